@@ -7,6 +7,9 @@ from .resolver import (
     ResolvedProject,
     ResolverConfig,
     resolve_project,
+    resolve_from_ast,
+    resolve_source,
+    validate_root,
 )
 
 from .graph import (
@@ -17,7 +20,7 @@ from .graph import (
     build_call_graph,
 )
 
-from .renderer import RendererConfig, build_dot, write_svg
+from .renderer import RendererConfig, build_dot, build_dot_from_graph, write_svg
 
 __all__ = [
     "SourceLocation",
@@ -27,6 +30,9 @@ __all__ = [
     "ResolvedProject",
     "ResolverConfig",
     "resolve_project",
+    "resolve_from_ast",
+    "resolve_source",
+    "validate_root",
     "GraphConfig",
     "GraphNode",
     "GraphEdge",
@@ -34,6 +40,7 @@ __all__ = [
     "build_call_graph",
     "RendererConfig",
     "build_dot",
+    "build_dot_from_graph",
     "write_svg",
 ]
 
@@ -3,11 +3,12 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, TextIO
 
-from .resolver import ResolverConfig, resolve_project
-from .graph import GraphConfig
+from .resolver import ResolvedProject, ResolverConfig, resolve_project, validate_root
+from .graph import GraphConfig, build_call_graph
 from .renderer import RendererConfig, build_dot, write_svg
 
 
@@ -104,16 +105,34 @@ def main(argv: Any | None = None) -> int:
     args = parser.parse_args(argv)
 
     root = Path(args.root)
-    project = resolve_project(root, config=ResolverConfig())
 
+    if args.filter is not None and not _parse_filter_keywords(args.filter):
+        # Nothing can match (see _render_from_project), so skip resolving the project.
+        project = ResolvedProject(root=validate_root(root), symbols={}, calls=[])
+    else:
+        project = resolve_project(root, config=ResolverConfig())
+
+    return _render_from_project(project, args)
+
+
+def _parse_filter_keywords(raw: Optional[str]) -> List[str]:
+    """Split a comma-separated --filter value into stripped, non-empty keywords."""
+    if raw is None:
+        return []
+    return [kw.strip() for kw in raw.split(",") if kw.strip()]
+
+
+def _render_from_project(project: ResolvedProject, args: argparse.Namespace) -> int:
+    """
+    Emit the output selected by the parsed CLI `args` for an already resolved
+    project. Returns the process exit code.
+    """
     # Parse filter keywords for all formats
-    filter_keywords = []
-    if args.filter is not None:
-        filter_keywords = [kw.strip() for kw in args.filter.split(",") if kw.strip()]
-        # If filter was provided but resulted in no keywords (e.g., empty string or whitespace only),
-        # treat it as wanting to filter everything out (match nothing)
-        if not filter_keywords and args.filter is not None:
-            filter_keywords = ["__MATCH_NOTHING__"]
+    filter_keywords = _parse_filter_keywords(args.filter)
+    if args.filter is not None and not filter_keywords:
+        # A filter that yields no keywords (e.g. empty string or whitespace only)
+        # matches nothing, so every format renders an empty project.
+        project = ResolvedProject(root=project.root, symbols={}, calls=[])
 
     # Simple modes do not need graph/renderer
     if args.format == "summary":
@@ -125,8 +144,7 @@ def main(argv: Any | None = None) -> int:
     if args.format == "json":
         if filter_keywords:
             project = _filter_project(project, filter_keywords, args.link_by_filter)
-        data = _resolved_project_to_jsonable(project)
-        print(json.dumps(data, indent=2, ensure_ascii=False))
+        _write_json(project, sys.stdout)
         return 0
 
     # Graph-based modes: DOT or SVG
@@ -159,33 +177,53 @@ def main(argv: Any | None = None) -> int:
     return 0
 
 
-def _resolved_project_to_jsonable(project) -> Dict[str, Any]:
+def _write_json(project, out: TextIO) -> None:
+    """
+    Stream the resolver output to `out` as JSON.
+
+    Symbols and calls are serialized one at a time instead of building the
+    whole document as a dict and encoding it in one go.
+    """
+    write = out.write
+    write('{\n  "root": ')
+    write(json.dumps(str(project.root), ensure_ascii=False))
+    write(',\n  "symbols": [')
+    sep = "\n    "
+    symbols = project.symbols
+    for sym_id in project.sorted_ids:
+        write(sep)
+        write(json.dumps(_symbol_to_jsonable(symbols[sym_id]), ensure_ascii=False))
+        sep = ",\n    "
+    write('\n  ],\n  "calls": [')
+    sep = "\n    "
+    for c in project.calls:
+        write(sep)
+        write(json.dumps(_call_to_jsonable(c), ensure_ascii=False))
+        sep = ",\n    "
+    write("\n  ]\n}\n")
+
+
+def _symbol_to_jsonable(s) -> Dict[str, Any]:
+    return {
+        "id": s.id,
+        "kind": s.kind,
+        "name": s.name,
+        "qualname": s.qualname,
+        "module": s.module,
+        "file": str(s.file),
+        "start_line": s.start_line,
+        "end_line": s.end_line,
+    }
+
+
+def _call_to_jsonable(c) -> Dict[str, Any]:
     return {
-        "root": str(project.root),
-        "symbols": [
-            {
-                "id": s.id,
-                "kind": s.kind,
-                "name": s.name,
-                "qualname": s.qualname,
-                "module": s.module,
-                "file": str(s.file),
-                "start_line": s.start_line,
-                "end_line": s.end_line,
-            }
-            for s in sorted(project.symbols.values(), key=lambda s: s.id)
-        ],
-        "calls": [
-            {
-                "caller_id": c.caller_id,
-                "raw_callee": c.raw_callee,
-                "callee_id": c.callee_id,
-                "file": str(c.location.file),
-                "lineno": c.location.lineno,
-                "col_offset": c.location.col_offset,
-            }
-            for c in project.calls
-        ],
+        "caller_id": c.caller_id,
+        "raw_callee": c.raw_callee,
+        "callee_id": c.callee_id,
+        "file": str(c.location.file),
+        "lineno": c.location.lineno,
+        "col_offset": c.location.col_offset,
     }
 
 
@@ -195,8 +233,6 @@ def _filter_project(project, filter_keywords, link_by_filter):
     
     Returns a new ResolvedProject with filtered symbols and calls.
     """
-    from .graph import GraphConfig, build_call_graph
-    
     # Build a graph with filtering enabled
     graph_cfg = GraphConfig(
         node_granularity="function",
@@ -232,7 +268,6 @@ def _filter_project(project, filter_keywords, link_by_filter):
                 filtered_calls.append(call)
     
     # Create new ResolvedProject with filtered data
-    from .resolver import ResolvedProject
     return ResolvedProject(
         root=project.root,
         symbols=filtered_symbols,
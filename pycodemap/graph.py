@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import re
+from array import array
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Literal, Optional, Tuple, List, Set
+from typing import Dict, Literal, Optional, Sequence, Tuple, List, Set
 
 from .resolver import ResolvedProject, Symbol
 
@@ -11,7 +14,7 @@ NodeGranularity = Literal["function", "file"]
 NodeKind = Literal["function", "file", "attribute"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GraphNode:
     """
     A node in the call graph.
@@ -34,7 +37,7 @@ class GraphNode:
     cluster: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphEdge:
     """
     A directed edge in the call graph.
@@ -65,16 +68,42 @@ class CallGraph:
     - selecting nodes (function vs file)
     - aggregating call edges
     - optionally pruning transitive edges
+
+    `edges` is keyed by ``(src, dst)``, so edge lookups are O(1) membership
+    tests on the dict.
     """
 
     nodes: Dict[str, GraphNode]
     edges: Dict[Tuple[str, str], GraphEdge]
 
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self.nodes
+
+    def has_edge(self, src: str, dst: str) -> bool:
+        return (src, dst) in self.edges
+
     def iter_edges(self) -> List[GraphEdge]:
         return list(self.edges.values())
 
-
-@dataclass
+    def to_index_arrays(self) -> Tuple[List[str], "array[int]", "array[int]"]:
+        """
+        Return the edge structure as parallel integer arrays.
+
+        Returns ``(node_ids, src, dst)``: edge ``i`` goes from
+        ``node_ids[src[i]]`` to ``node_ids[dst[i]]``. `node_ids` lists the
+        graph's nodes first (in insertion order), followed by any edge endpoint
+        that has no node of its own.
+        """
+        index: Dict[str, int] = {node_id: i for i, node_id in enumerate(self.nodes)}
+        src: "array[int]" = array("i")
+        dst: "array[int]" = array("i")
+        for u, v in self.edges:
+            src.append(index.setdefault(u, len(index)))
+            dst.append(index.setdefault(v, len(index)))
+        return list(index), src, dst
+
+
+@dataclass(frozen=True, slots=True)
 class GraphConfig:
     """
     Configuration controlling how a call graph is built from a `ResolvedProject`.
@@ -91,8 +120,9 @@ class GraphConfig:
         If True, run a simple transitive-reduction pass to remove edges (u, v)
         whenever there exists an alternate path from u to v.
     filter_keywords:
-        List of keywords to filter nodes. A node is kept if its name/qualname contains
-        any of the keywords. If empty, no filtering is applied.
+        Keywords to filter nodes (any sequence; stored as a tuple). A node is
+        kept if its name/qualname contains any of the keywords. If empty, no
+        filtering is applied.
     link_by_filter:
         If True and filter_keywords is not empty, also keep nodes that are called by
         filtered nodes (transitively). Has no effect if filter_keywords is empty.
@@ -101,12 +131,13 @@ class GraphConfig:
     node_granularity: NodeGranularity = "function"
     cluster_by_module: bool = True
     prune_transitive: bool = False
-    filter_keywords: List[str] = None
+    filter_keywords: Sequence[str] = ()
     link_by_filter: bool = False
 
     def __post_init__(self):
-        if self.filter_keywords is None:
-            self.filter_keywords = []
+        # Stored as a tuple so the config stays hashable (usable as a cache key)
+        keywords = () if self.filter_keywords is None else tuple(self.filter_keywords)
+        object.__setattr__(self, "filter_keywords", keywords)
 
 
 def build_call_graph(project: ResolvedProject, config: Optional[GraphConfig] = None) -> CallGraph:
@@ -294,45 +325,147 @@ def _prune_transitive_edges(graph: CallGraph) -> None:
     For each edge (u, v), if there exists an alternate path from u to v using
     other edges, then (u, v) is removed.
 
-    Complexity: O(|E| * (|V| + |E|)), which is fine for this project.
+    Works on the integer form from `CallGraph.to_index_arrays`. Reachability is
+    computed once as int bitsets over the strongly connected components, so
+    edges leaving a node that is not on a cycle (the common case) are decided
+    with a few big-int operations. Edges leaving a node on a cycle fall back
+    to a BFS per edge, O(|V| + |E|) each.
     """
-    # Build adjacency lists
-    adj: Dict[str, Set[str]] = {node_id: set() for node_id in graph.nodes.keys()}
-    for edge in graph.edges.values():
-        adj.setdefault(edge.src, set()).add(edge.dst)
+    node_ids, src, dst = graph.to_index_arrays()
 
-    redundant: Set[Tuple[str, str]] = set()
+    # Build adjacency lists
+    adj: List[List[int]] = [[] for _ in node_ids]
+    for u, v in zip(src, dst):
+        adj[u].append(v)
 
-    for key, edge in list(graph.edges.items()):
-        u, v = edge.src, edge.dst
-        if _has_alternate_path(adj, u, v, skip_edge=(u, v)):
-            redundant.add((u, v))
+    redundant = _redundant_edges(adj)
 
     # Remove redundant edges
-    for key in redundant:
-        graph.edges.pop(key, None)
+    for u, v in redundant:
+        graph.edges.pop((node_ids[u], node_ids[v]), None)
+
+
+def _redundant_edges(adj: List[List[int]]) -> Set[Tuple[int, int]]:
+    """
+    Return the edges (u, v) of `adj` for which another path from u to v exists.
+
+    Node x owns bit ``1 << x``. Each component gets an int with the bits of
+    every node reachable from it (its own members included), built in the
+    reverse topological order the components come out of Tarjan's algorithm.
+
+    If u is not on a cycle, no path from one of its successors comes back
+    through u, so (u, v) is redundant iff another successor of u reaches v.
+    Otherwise the edge is checked with `_has_alternate_path`.
+    """
+    components = _strongly_connected_components(adj)
+    comp_of = [0] * len(adj)
+    reach = [0] * len(components)
+    for c, members in enumerate(components):
+        r = 0
+        for x in members:
+            comp_of[x] = c
+            r |= 1 << x
+        # Successor components were emitted earlier, so their reach is final.
+        for x in members:
+            for w in adj[x]:
+                if comp_of[w] != c:
+                    r |= reach[comp_of[w]]
+        reach[c] = r
+
+    redundant: Set[Tuple[int, int]] = set()
+    for u, succs in enumerate(adj):
+        if not succs:
+            continue
+        if len(components[comp_of[u]]) > 1 or u in succs:
+            redundant.update(
+                (u, v) for v in succs if _has_alternate_path(adj, u, v, skip_edge=(u, v))
+            )
+            continue
+        # Bits of nodes reachable from u through a successor other than the
+        # node itself, i.e. via a path of length >= 2.
+        indirect = 0
+        for w in succs:
+            indirect |= reach[comp_of[w]] & ~(1 << w)
+        for w in succs:
+            if indirect >> w & 1:
+                redundant.add((u, w))
+
+    return redundant
+
+
+def _strongly_connected_components(adj: List[List[int]]) -> List[List[int]]:
+    """
+    Return the strongly connected components of `adj` (iterative Tarjan).
+
+    Components are listed in reverse topological order: every component comes
+    after all the components it has edges into.
+    """
+    n = len(adj)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        # (node, position of the next successor to visit)
+        work: List[Tuple[int, int]] = [(root, 0)]
+        while work:
+            v, i = work.pop()
+            if i == 0:
+                index[v] = low[v] = counter
+                counter += 1
+                stack.append(v)
+                on_stack[v] = True
+            else:
+                # Back from the DFS into adj[v][i - 1].
+                low[v] = min(low[v], low[adj[v][i - 1]])
+
+            succs = adj[v]
+            while i < len(succs):
+                w = succs[i]
+                i += 1
+                if index[w] == -1:
+                    work.append((v, i))
+                    work.append((w, 0))
+                    break
+                if on_stack[w]:
+                    low[v] = min(low[v], index[w])
+            else:
+                if low[v] == index[v]:
+                    component: List[int] = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+
+    return components
 
 
 def _has_alternate_path(
-    adj: Dict[str, Set[str]],
-    start: str,
-    target: str,
-    skip_edge: Tuple[str, str],
+    adj: List[List[int]],
+    start: int,
+    target: int,
+    skip_edge: Tuple[int, int],
 ) -> bool:
     """
     Return True if there exists a path from `start` to `target` that does NOT
     use the edge `skip_edge`.
     """
-    from collections import deque
-
-    visited: Set[str] = set()
-    queue: "deque[str]" = deque()
+    visited: Set[int] = set()
+    queue: "deque[int]" = deque()
     visited.add(start)
     queue.append(start)
 
     while queue:
         u = queue.popleft()
-        for w in adj.get(u, ()):
+        for w in adj[u]:
             if (u, w) == skip_edge:
                 continue
             if w == target:
@@ -358,14 +491,23 @@ def _apply_filter(graph: CallGraph, keywords: List[str], link_by_filter: bool) -
     if not keywords:
         return
     
-    # Find nodes that match any keyword
-    matched_nodes: Set[str] = set()
-    for node_id, node in graph.nodes.items():
-        # Check if any keyword is contained in the node label or ID
-        for keyword in keywords:
-            if keyword in node.label or keyword in node_id:
-                matched_nodes.add(node_id)
-                break
+    # Find nodes that match any keyword. A single keyword uses the plain
+    # substring test; several are folded into one alternation so each
+    # label/ID is scanned once instead of once per keyword.
+    if len(keywords) == 1:
+        keyword = keywords[0]
+        matched_nodes: Set[str] = {
+            node_id
+            for node_id, node in graph.nodes.items()
+            if keyword in node.label or keyword in node_id
+        }
+    else:
+        search = re.compile("|".join(map(re.escape, keywords))).search
+        matched_nodes = {
+            node_id
+            for node_id, node in graph.nodes.items()
+            if search(node.label) or search(node_id)
+        }
     
     # If no matches, keep no nodes
     if not matched_nodes:
@@ -383,7 +525,6 @@ def _apply_filter(graph: CallGraph, keywords: List[str], link_by_filter: bool) -
             adj.setdefault(edge.src, set()).add(edge.dst)
         
         # For each matched node, find all reachable nodes (callees)
-        from collections import deque
         for start_node in matched_nodes:
             visited: Set[str] = set()
             queue: deque[str] = deque([start_node])
@@ -1,25 +1,65 @@
 # pycodemap/renderer.py
 from __future__ import annotations
 
+import functools
+import importlib.util
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Literal
+from typing import Dict, List, Optional, Literal, Tuple
 
 from .resolver import ResolvedProject, Symbol
 from .graph import CallGraph, GraphConfig, GraphNode, build_call_graph
 
-try:
-    from pygments import highlight
-    from pygments.lexers import PythonLexer
-    from pygments.token import Token
-    PYGMENTS_AVAILABLE = True
-except ImportError:
-    PYGMENTS_AVAILABLE = False
+# Pygments is optional and slow to import, so it is only imported the first
+# time a code label is built (see `_ensure_pygments`). Until then this flag
+# only says whether the package is installed.
+PYGMENTS_AVAILABLE = importlib.util.find_spec("pygments") is not None
+
+# Set up by `_ensure_pygments`; the lexer keeps no state between get_tokens()
+# calls, so one instance is shared by every code label.
+_PY_LEXER = None
+_TOKEN_COLORS: Dict[object, str] = {}
+
+
+def _ensure_pygments() -> bool:
+    """Import Pygments and build the lexer on first use; False if unavailable."""
+    global PYGMENTS_AVAILABLE, _PY_LEXER, _TOKEN_COLORS
+    if not PYGMENTS_AVAILABLE:
+        return False
+    if _PY_LEXER is not None:
+        return True
+    try:
+        from pygments.lexers.python import PythonLexer
+        from pygments.token import Token
+    except ImportError:
+        PYGMENTS_AVAILABLE = False
+        return False
+
+    # Color mapping for Python tokens
+    _TOKEN_COLORS = {
+        Token.Keyword: "#0000FF",           # Blue for keywords
+        Token.Keyword.Namespace: "#0000FF",
+        Token.Keyword.Type: "#0000FF",
+        Token.Name.Builtin: "#0000FF",
+        Token.Name.Function: "#000000",
+        Token.Name.Class: "#267F99",        # Teal for classes
+        Token.String: "#A31515",            # Red for strings
+        Token.String.Doc: "#008000",        # Green for docstrings
+        Token.Comment: "#008000",           # Green for comments
+        Token.Comment.Single: "#008000",
+        Token.Comment.Multiline: "#008000",
+        Token.Number: "#098658",            # Dark green for numbers
+        Token.Operator: "#000000",
+        Token.Punctuation: "#000000",
+    }
+    _PY_LEXER = PythonLexer()
+    return True
+
 
 LabelMode = Literal["name", "qualname", "code"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RendererConfig:
     """
     Controls how nodes and edges are rendered into a DOT graph.
@@ -42,6 +82,10 @@ class RendererConfig:
     max_snippet_lines: int = 6
 
 
+_LABEL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\l"})
+
+
+@functools.lru_cache(maxsize=4096)
 def _escape_label(text: str) -> str:
     """
     Escape a label string for use in DOT.
@@ -49,9 +93,7 @@ def _escape_label(text: str) -> str:
     - backslashes and quotes are escaped
     - newlines become `\\l` (Graphviz left-justified line break)
     """
-    text = text.replace("\\", "\\\\").replace('"', '\\"')
-    text = text.replace("\n", "\\l")
-    return text
+    return text.translate(_LABEL_ESCAPES)
 
 def _sanitize_id(s: str) -> str:
     """
@@ -70,18 +112,33 @@ def build_dot(
     Build a Graphviz DOT string from a resolved project.
 
     This is a pure function: it does not touch the filesystem or run Graphviz.
+    To render one graph several ways (e.g. with different label modes), build
+    it once with `build_call_graph` and call `build_dot_from_graph` instead.
     """
     call_graph: CallGraph = build_call_graph(project, graph_config)
+    return build_dot_from_graph(call_graph, project, renderer_config)
 
 
+def build_dot_from_graph(
+    call_graph: CallGraph,
+    project: ResolvedProject,
+    renderer_config: RendererConfig,
+) -> str:
+    """
+    Build a Graphviz DOT string from an already built call graph.
+
+    `project` must be the project `call_graph` was built from; its symbols
+    provide names and code snippets for the node labels.
+    """
     lines: List[str] = []
-    lines.append("digraph CallGraph {")
-    lines.append('  rankdir=LR;')
-    lines.append(
+    append = lines.append
+    append("digraph CallGraph {")
+    append('  rankdir=LR;')
+    append(
         '  node [shape=box, style=filled, fillcolor="#f6f6f6", '
         'fontname="Menlo,Consolas,monospace", margin="0.2,0.1"];'
     )
-    lines.append('  edge [fontname="Menlo,Consolas,monospace"];')
+    append('  edge [fontname="Menlo,Consolas,monospace"];')
 
     # Group nodes by cluster so the renderer can draw module-based clusters.
     clusters: Dict[Optional[str], List[GraphNode]] = {}
@@ -92,28 +149,23 @@ def build_dot(
     for cluster_id, nodes in sorted(clusters.items(), key=lambda kv: str(kv[0])):
         if cluster_id is not None:
             subgraph_name = f"cluster_{_sanitize_id(cluster_id)}"
-            lines.append(f'  subgraph "{subgraph_name}" {{')
-            lines.append(f'    label="{_escape_label(cluster_id)}";')
-            lines.append("    style=rounded;")
+            append(f'  subgraph "{subgraph_name}" {{')
+            append(f'    label="{_escape_label(cluster_id)}";')
+            append("    style=rounded;")
             indent = "    "
         else:
             indent = "  "
 
         for node in sorted(nodes, key=lambda n: n.id):
-            label_result = _node_label(node, project, renderer_config)
-            
-            if isinstance(label_result, tuple):  # HTML label
-                html_label, _ = label_result
-                lines.append(
-                    f'{indent}"{_sanitize_id(node.id)}" [label=<{html_label}>];'
-                )
-            else:  # Plain text label
-                lines.append(
-                    f'{indent}"{_sanitize_id(node.id)}" [label="{_escape_label(label_result)}"];'
-                )
+            label, is_html = _node_label(node, project, renderer_config)
+
+            if is_html:  # HTML label
+                append(f'{indent}"{_sanitize_id(node.id)}" [label=<{label}>];')
+            else:  # Plain text label, already escaped
+                append(f'{indent}"{_sanitize_id(node.id)}" [label="{label}"];')
 
         if cluster_id is not None:
-            lines.append("  }")
+            append("  }")
 
 
 
@@ -125,18 +177,18 @@ def build_dot(
         if renderer_config.show_line_numbers:
             nums = sorted(set(edge.line_numbers or []))
             if nums:
-                num_list = ", ".join(str(n) for n in nums)
+                num_list = ", ".join(map(str, nums))
                 label = f"{edge.call_count}: [{num_list}]"
             else:
                 label = str(edge.call_count)
-            lines.append(f'  "{src}" -> "{dst}" [label="{label}"];')
+            append(f'  "{src}" -> "{dst}" [label="{label}"];')
         else:
             if edge.call_count > 1:
-                lines.append(f'  "{src}" -> "{dst}" [label="{edge.call_count}"];')
+                append(f'  "{src}" -> "{dst}" [label="{edge.call_count}"];')
             else:
-                lines.append(f'  "{src}" -> "{dst}";')
+                append(f'  "{src}" -> "{dst}";')
 
-    lines.append("}")
+    append("}")
     return "\n".join(lines)
 
 def _build_html_label(header: str, code: str, start_line: Optional[int] = None) -> str:
@@ -144,26 +196,9 @@ def _build_html_label(header: str, code: str, start_line: Optional[int] = None)
     Build an HTML-like label for Graphviz with syntax highlighting.
     Uses Pygments to tokenize Python code and applies colors.
     """
-    lexer = PythonLexer()
-    tokens = list(lexer.get_tokens(code))
-    
-    # Color mapping for Python tokens
-    token_colors = {
-        Token.Keyword: "#0000FF",           # Blue for keywords
-        Token.Keyword.Namespace: "#0000FF",
-        Token.Keyword.Type: "#0000FF",
-        Token.Name.Builtin: "#0000FF",
-        Token.Name.Function: "#000000",
-        Token.Name.Class: "#267F99",        # Teal for classes
-        Token.String: "#A31515",            # Red for strings
-        Token.String.Doc: "#008000",        # Green for docstrings
-        Token.Comment: "#008000",           # Green for comments
-        Token.Comment.Single: "#008000",
-        Token.Comment.Multiline: "#008000",
-        Token.Number: "#098658",            # Dark green for numbers
-        Token.Operator: "#000000",
-        Token.Punctuation: "#000000",
-    }
+    if not _ensure_pygments():
+        raise RuntimeError("Pygments is required for highlighted code labels")
+    tokens = list(_PY_LEXER.get_tokens(code))
     
     # Build HTML table with header and code rows
     rows = [f'<TR><TD ALIGN="LEFT" VALIGN="MIDDLE"><B>{_escape_html(header)}</B></TD></TR>']
@@ -177,11 +212,7 @@ def _build_html_label(header: str, code: str, start_line: Optional[int] = None)
             parts = value.split('\n')
             for i, part in enumerate(parts):
                 if part:
-                    color = _get_token_color(token_type, token_colors)
-                    if color:
-                        current_line.append(f'<FONT COLOR="{color}">{_escape_html(part)}</FONT>')
-                    else:
-                        current_line.append(_escape_html(part))
+                    current_line.append(_token_html(token_type, part))
                 
                 if i < len(parts) - 1:  # Not the last part (there's a newline)
                     line_text = ''.join(current_line) if current_line else '&#160;'
@@ -192,11 +223,7 @@ def _build_html_label(header: str, code: str, start_line: Optional[int] = None)
                     current_line = []
         else:
             if value:
-                color = _get_token_color(token_type, token_colors)
-                if color:
-                    current_line.append(f'<FONT COLOR="{color}">{_escape_html(value)}</FONT>')
-                else:
-                    current_line.append(_escape_html(value))
+                current_line.append(_token_html(token_type, value))
     
     # Flush any remaining content
     if current_line:
@@ -208,21 +235,34 @@ def _build_html_label(header: str, code: str, start_line: Optional[int] = None)
     return '<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="0" CELLPADDING="2" FIXEDSIZE="FALSE">' + ''.join(rows) + '</TABLE>'
 
 
-def _get_token_color(token_type, color_map: dict) -> Optional[str]:
+@functools.lru_cache(maxsize=8192)
+def _token_html(token_type, value: str) -> str:
+    """Escaped, colored HTML for one token; keywords and punctuation repeat a lot."""
+    color = _get_token_color(token_type)
+    if color:
+        return f'<FONT COLOR="{color}">{_escape_html(value)}</FONT>'
+    return _escape_html(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_token_color(token_type) -> Optional[str]:
     """Get color for a token type, checking parent types if exact match not found."""
-    if token_type in color_map:
-        return color_map[token_type]
+    if token_type in _TOKEN_COLORS:
+        return _TOKEN_COLORS[token_type]
     # Check parent token types
     while token_type.parent:
         token_type = token_type.parent
-        if token_type in color_map:
-            return color_map[token_type]
+        if token_type in _TOKEN_COLORS:
+            return _TOKEN_COLORS[token_type]
     return None
 
 
+_HTML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
 def _escape_html(text: str) -> str:
     """Escape HTML special characters for use in Graphviz HTML-like labels."""
-    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+    return text.translate(_HTML_ESCAPES)
 
 
 def write_svg(dot: str, output: Path) -> None:  # pragma: no cover
@@ -242,47 +282,59 @@ def write_svg(dot: str, output: Path) -> None:  # pragma: no cover
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _node_label(node: GraphNode, project: ResolvedProject, cfg: RendererConfig):
+def _node_label(node: GraphNode, project: ResolvedProject, cfg: RendererConfig) -> Tuple[str, bool]:
     """
     Build the label for a node based on the renderer configuration.
-    Returns either a string (plain text) or tuple (HTML label, is_html=True).
+    Returns ``(label, is_html)``; plain-text labels are already DOT-escaped.
     """
     sym: Optional[Symbol] = (
         project.symbols.get(node.symbol_id) if node.symbol_id else None
     )
+    # Unknown modes render like "name"
+    return _LABEL_BUILDERS.get(cfg.label_mode, _name_label)(node, sym, cfg)
+
+
+def _code_label(node: GraphNode, sym: Optional[Symbol], cfg: RendererConfig) -> Tuple[str, bool]:
+    """Code snippet label with syntax highlighting; symbols without code use `_name_label`."""
+    if sym is None or not sym.snippet:
+        return _name_label(node, sym, cfg)
+
+    lines = sym.snippet.splitlines()
+    if cfg.max_snippet_lines > 0:
+        lines = lines[: cfg.max_snippet_lines]
+
+    snippet_text = "\n".join(lines)
+
+    # Use Pygments HTML-like labels for syntax highlighting
+    if _ensure_pygments():
+        try:
+            html_label = _build_html_label(sym.qualname, snippet_text, sym.start_line if cfg.show_line_numbers else None)
+            return (html_label, True)
+        except Exception:
+            pass  # Fall through to plain text
+
+    # Fallback to plain text: escape each line and join with `\l` in one pass
+    if cfg.show_line_numbers:
+        start = sym.start_line
+        lines = [f"{start + i}: {line}" for i, line in enumerate(lines)]
+    parts = [_escape_label(sym.qualname)]
+    parts.extend(line.translate(_LABEL_ESCAPES) for line in lines)
+    # One trailing line break, which a blank last line already provides
+    if not lines or lines[-1]:
+        parts.append("")
+    return "\\l".join(parts), False
+
 
-    # Code snippet label with syntax highlighting
-    if cfg.label_mode == "code" and sym is not None and sym.snippet:
-        lines = sym.snippet.splitlines()
-        if cfg.max_snippet_lines > 0:
-            lines = lines[: cfg.max_snippet_lines]
-
-        snippet_text = "\n".join(lines)
-        
-        # Use Pygments HTML-like labels for syntax highlighting
-        if PYGMENTS_AVAILABLE:
-            try:
-                html_label = _build_html_label(sym.qualname, snippet_text, sym.start_line if cfg.show_line_numbers else None)
-                return (html_label, True)
-            except Exception:
-                pass  # Fall through to plain text
-        
-        # Fallback to plain text
-        if cfg.show_line_numbers:
-            start = sym.start_line
-            lines = [f"{start + i}: {line}" for i, line in enumerate(lines)]
-        label = sym.qualname + "\n" + "\n".join(lines)
-        if not label.endswith("\n"):
-            label += "\n"
-        return label
-
-    # Name / qualname label
-    if sym is not None:
-        if cfg.label_mode == "qualname":
-            return sym.qualname
-        base = sym.name
-    else:
-        base = node.label
+def _qualname_label(node: GraphNode, sym: Optional[Symbol], cfg: RendererConfig) -> Tuple[str, bool]:
+    """Fully qualified symbol name; nodes without a symbol use `_name_label`."""
+    if sym is None:
+        return _name_label(node, sym, cfg)
+    return _escape_label(sym.qualname), False
+
+
+def _name_label(node: GraphNode, sym: Optional[Symbol], cfg: RendererConfig) -> Tuple[str, bool]:
+    """Short name, plus the module (file nodes) and line range when configured."""
+    base = sym.name if sym is not None else node.label
 
     extras: List[str] = []
     if cfg.show_module and node.module and getattr(node, "kind", None) == "file":
@@ -293,26 +345,13 @@ def _node_label(node: GraphNode, project: ResolvedProject, cfg: RendererConfig):
         extras.append(f"lines {sym.start_line}-{sym.end_line}")
 
     if extras:
-        return base + "\\n" + " · ".join(extras)
-    return base
-
-
-def _escape_label(text: str) -> str:
-    """
-    Escape a label string for use in DOT.
-
-    - backslashes and quotes are escaped
-    - newlines become `\\l` (Graphviz left-justified line break)
-    """
-    text = text.replace("\\", "\\\\").replace('"', '\\"')
-    text = text.replace("\n", "\\l")
-    return text
+        return _escape_label(f"{base}\\n{' · '.join(extras)}"), False
+    return _escape_label(base), False
 
 
-def _sanitize_id(s: str) -> str:
-    """
-    Sanitize an identifier for use in DOT.
-
-    Since we always quote IDs, this only needs to escape quotes.
-    """
-    return s.replace('"', '\\"')
+# label_mode -> label builder, looked up once per node instead of an if-chain
+_LABEL_BUILDERS = {
+    "name": _name_label,
+    "qualname": _qualname_label,
+    "code": _code_label,
+}
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import ast
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Literal, Iterable, Tuple, DefaultDict
 import os
+import sys
 from collections import defaultdict
 
 __all__ = [
@@ -15,13 +18,16 @@ __all__ = [
     "ResolvedProject",
     "ResolverConfig",
     "resolve_project",
+    "resolve_from_ast",
+    "resolve_source",
+    "validate_root",
 ]
 
 SymbolKind = Literal["function", "method", "class", "module", "file", "attribute"]
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceLocation:
     """
     Represents a concrete location in a source file.
@@ -38,7 +44,7 @@ class SourceLocation:
         return root / self.file
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Symbol:
     """A named thing in the project (function, method, class, module, or file)."""
 
@@ -53,7 +59,7 @@ class Symbol:
     snippet: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Call:
     """
     Represents a call site in the code.
@@ -86,6 +92,22 @@ class ResolvedProject:
         """Convenience helper to get only functions + methods."""
         return [s for s in self.symbols.values() if s.kind in ("function", "method")]
 
+    # The two indexes below are computed on first access and then kept, so
+    # `symbols` must not be modified once they have been read.
+
+    @functools.cached_property
+    def symbols_by_module(self) -> Dict[str, List[str]]:
+        """Symbol IDs grouped by module, in discovery order."""
+        by_module: DefaultDict[str, List[str]] = defaultdict(list)
+        for sym_id, sym in self.symbols.items():
+            by_module[sym.module].append(sym_id)
+        return dict(by_module)
+
+    @functools.cached_property
+    def sorted_ids(self) -> List[str]:
+        """All symbol IDs in sorted order."""
+        return sorted(self.symbols)
+
 
 @dataclass
 class ResolverConfig:
@@ -107,6 +129,52 @@ class ResolverConfig:
         "venv",
         "env",
     )
+    # Worker processes used to parse and scan files. Parallel scanning is
+    # opt-in and API-only (the CLI always scans serially): the default 1
+    # scans serially, None means one worker per CPU.
+    # Projects below ``_PARALLEL_MIN_FILES`` files, or an effective worker
+    # count of 1, always scan serially. Workers are started with the platform's
+    # multiprocessing start method; with "spawn" (the default on macOS and
+    # Windows) the calling script needs an ``if __name__ == "__main__":`` guard.
+    max_workers: Optional[int] = 1
+
+
+# Below this many files, process start-up (slowest with "spawn") and shipping
+# scans back to the parent cost more than parallel parsing saves.
+_PARALLEL_MIN_FILES = 64
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_project_cached(
+    root: Path,
+    fingerprint: Tuple[Tuple[Path, int, int, int], ...],
+    max_workers: Optional[int] = None,
+) -> ResolvedProject:
+    """Parse and resolve the files listed in a `resolve_project` fingerprint."""
+    # ------------------------------------------------------------------
+    # Parse and scan every file independently; only linking needs them all
+    # ------------------------------------------------------------------
+    root_is_file = root.is_file()
+    jobs: List[Tuple[Path, Path, str]] = []  # (path, rel_path, module)
+    for path, *_ in fingerprint:
+        # If root is a file, use the file's name as the relative path
+        if root_is_file:
+            rel = Path(path.name)
+        else:
+            rel = path.relative_to(root)
+        jobs.append((path, rel, _module_name_from_path(rel)))
+
+    workers = min(len(jobs), max_workers if max_workers is not None else (os.cpu_count() or 1))
+    if workers <= 1 or len(jobs) < _PARALLEL_MIN_FILES:
+        scans = [_scan_file(*job) for job in jobs]
+    else:
+        paths, rels, modules = zip(*jobs)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() yields in input order, so the merge matches a serial scan.
+            chunksize = max(1, len(jobs) // (4 * workers))
+            scans = list(pool.map(_scan_file, paths, rels, modules, chunksize=chunksize))
+
+    return _link_modules(root, scans)
 
 
 def resolve_project(root: Path, config: Optional[ResolverConfig] = None) -> ResolvedProject:
@@ -114,14 +182,15 @@ def resolve_project(root: Path, config: Optional[ResolverConfig] = None) -> Reso
     Resolve a Python project into a `ResolvedProject`.
 
     1. Walk the directory tree from ``root`` and find all ``.py`` files.
-    2. First pass:
-       - Parse every file into an AST.
+    2. Scan every file (optionally in worker processes, see
+       ``ResolverConfig.max_workers``):
+       - Parse it into an AST.
        - Create a *module symbol* per file.
-       - Extract functions/methods/classes as `Symbol`s.
+       - In a single traversal, extract functions/methods/classes as `Symbol`s
+         and record call sites.
     3. Build an index over all symbols.
-    4. Second pass:
-       - Traverse ASTs again and record call sites.
-       - Try to resolve each call to a `Symbol.id` using a simple static analysis.
+    4. Try to resolve each recorded call to a `Symbol.id` using a simple static
+       analysis.
 
     Parameters
     ----------
@@ -134,64 +203,133 @@ def resolve_project(root: Path, config: Optional[ResolverConfig] = None) -> Reso
     -------
     ResolvedProject
         A project model with discovered symbols and call sites.
+
+    Results are cached per root and per set of files, keyed on each file's
+    path, mtime, size and inode, so resolving an unchanged tree again skips
+    parsing. Each call returns a new `ResolvedProject` whose ``symbols`` and
+    ``calls`` containers the caller may modify freely; the (frozen) `Symbol`
+    and `Call` objects inside are shared with the cache.
+    ``resolve_project.cache_clear()`` empties the cache.
     """
-    root = root.resolve()
+    root = validate_root(root)
     if config is None:
         config = ResolverConfig()
 
+    fingerprint = tuple(
+        (path, st.st_mtime_ns, st.st_size, st.st_ino)
+        for path in _iter_python_files(root, config)
+        for st in (path.stat(),)
+    )
+    cached = _resolve_project_cached(root, fingerprint, config.max_workers)
+    return ResolvedProject(root=cached.root, symbols=dict(cached.symbols), calls=list(cached.calls))
+
+
+resolve_project.cache_clear = _resolve_project_cached.cache_clear  # type: ignore[attr-defined]
+
+
+def _scan_file(path: Path, rel_path: Path, module: str) -> _ModuleScan:
+    """Read, parse and scan one file; runs in a worker process when parallel scanning is on."""
+    source = path.read_text(encoding="utf-8")
+    # Same as ast.parse(), minus its wrapper; type comments stay off (the default).
+    tree = compile(source, str(rel_path), "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+    return _scan_module(tree, module=module, rel_path=rel_path, source=source)
+
+
+def resolve_from_ast(
+    tree: ast.Module,
+    module_name: str,
+    source: str = "",
+    root: Optional[Path] = None,
+) -> ResolvedProject:
+    """
+    Resolve a single, already parsed module without touching the filesystem.
+
+    The module's file is derived from `module_name` (``pkg.mod`` ->
+    ``pkg/mod.py``). Pass the original `source` to get code snippets on the
+    symbols; without it they are left empty. `root` defaults to ``Path(".")``.
+    """
+    rel = Path(*module_name.split(".")).with_suffix(".py")
+    if root is None:
+        root = Path(".")
+    return _resolve_modules(root, [(rel, module_name, source, tree)])
+
+
+def resolve_source(
+    module_name: str,
+    source: str,
+    root: Optional[Path] = None,
+) -> ResolvedProject:
+    """
+    Resolve a single module from its source text without touching the filesystem.
+
+    Parses `source` and hands it to `resolve_from_ast`; the same conventions
+    for the module's file and `root` apply.
+    """
+    filename = "/".join(module_name.split(".")) + ".py"
+    tree = compile(source, filename, "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+    return resolve_from_ast(tree, module_name, source, root)
+
+
+def validate_root(root: Path) -> Path:
+    """
+    Resolve ``root`` and check that it is a directory or a ``.py`` file.
+
+    Returns the resolved path, as used for `ResolvedProject.root`. Raises
+    ValueError otherwise.
+    """
+    root = root.resolve()
     if root.is_file():
         if root.suffix != ".py":
             raise ValueError(f"Project root is a file but not a .py file: {root}")
 
     elif not root.is_dir():
         raise ValueError(f"Project root does not exist or is not a directory: {root}")
+    return root
 
-    # ------------------------------------------------------------------
-    # First pass: collect ASTs + symbols
-    # ------------------------------------------------------------------
-    symbols: Dict[str, Symbol] = {}
-    file_infos: List[Tuple[Path, str, str, ast.AST]] = []  # (rel_path, module, source, tree)
 
-    for path in _iter_python_files(root, config):
-        # If root is a file, use the file's name as the relative path
-        if root.is_file():
-            rel = Path(path.name)
-        else:
-            rel = path.relative_to(root)
-        module = _module_name_from_path(rel)
-        source = path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(rel))
+def _resolve_modules(
+    root: Path,
+    file_infos: List[Tuple[Path, str, str, ast.AST]],
+) -> ResolvedProject:
+    """Resolve parsed ``(rel_path, module, source, tree)`` entries into a project."""
+    scans = [
+        _scan_module(tree, module=module, rel_path=rel, source=source)
+        for rel, module, source, tree in file_infos
+    ]
+    return _link_modules(root, scans)
+
 
-        source_lines = source.splitlines(keepends=True)
-        # Module-level symbol for this file
-        module_sym = _make_module_symbol(module, rel, source_lines)
+def _link_modules(root: Path, scans: List[_ModuleScan]) -> ResolvedProject:
+    """
+    Merge per-module scan results and resolve their call sites.
+
+    Calls can only be resolved once every module's symbols are known, so this
+    runs after all modules have been scanned.
+    """
+    symbols: Dict[str, Symbol] = {}
+    for _, module_sym, module_symbols, _ in scans:
         if module_sym.id not in symbols:
             symbols[module_sym.id] = module_sym
-
-        # Function / method / class symbols
-        for sym in _iter_symbols_from_ast(tree, module=module, rel_path=rel, source_lines=source_lines):
+        for sym in module_symbols:
             symbols[sym.id] = sym
 
-        file_infos.append((rel, module, source, tree))
-
     # Build an index over symbols for call resolution
     symbol_index = _build_symbol_index(symbols)
+    name_index = _build_name_index(symbol_index)
 
-    # ------------------------------------------------------------------
-    # Second pass: collect calls
-    # ------------------------------------------------------------------
     calls: List[Call] = []
-    for rel, module, source, tree in file_infos:
-        source_lines = source.splitlines(keepends=True)
-        visitor = _CallVisitor(
-            module=module,
-            rel_path=rel,
-            symbol_index=symbol_index,
-            symbol_index_flat=symbols,
-            source_lines=source_lines,
+    resolve_cache: Dict[Tuple[str, str], Optional[str]] = {}
+    for module, _, _, pending_calls in scans:
+        calls.extend(
+            _resolve_calls(
+                pending_calls,
+                module=module,
+                symbol_index=symbol_index,
+                symbol_index_flat=symbols,
+                name_index=name_index,
+                resolve_cache=resolve_cache,
+            )
         )
-        visitor.visit(tree)
-        calls.extend(visitor.calls)
 
     return ResolvedProject(root=root, symbols=symbols, calls=calls)
 
@@ -200,25 +338,44 @@ def resolve_project(root: Path, config: Optional[ResolverConfig] = None) -> Reso
 # Private helpers
 # ---------------------------------------------------------------------------
 
-def os_walk(root: Path) -> Iterable[Tuple[str, List[str], List[str]]]:
-    """Small wrapper to keep typing happy."""
-    return os.walk(root)
-
-
 def _iter_python_files(root: Path, config: ResolverConfig) -> Iterable[Path]:
+    """
+    Yield the ``.py`` files under ``root``, in the same order as ``os.walk``.
+
+    Uses ``os.scandir`` directly so each entry's type comes from the cached
+    ``DirEntry`` data instead of a fresh ``stat`` per ``Path``. Like
+    ``os.walk``, symlinked directories are never descended into; symlinked
+    files are only yielded when ``config.follow_symlinks`` is set.
+    """
     if root.is_file():
         yield root
         return
-    for dirpath, dirnames, filenames in os_walk(root):
-        # mutate dirnames in-place to respect exclude list
-        dirnames[:] = [d for d in dirnames if d not in config.exclude]
-        for name in filenames:
-            if not name.endswith(".py"):
+    exclude = frozenset(config.exclude)
+    follow_symlinks = config.follow_symlinks
+    stack: List[str] = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs: List[str] = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if entry.name not in exclude and not entry.is_symlink():
+                    subdirs.append(entry.path)
                 continue
-            path = Path(dirpath) / name
-            if not config.follow_symlinks and path.is_symlink():
+            if not entry.name.endswith(".py"):
                 continue
-            yield path
+            if not follow_symlinks and entry.is_symlink():
+                continue
+            yield Path(entry.path)
+        # Depth-first, visiting subdirectories in scandir order.
+        stack.extend(reversed(subdirs))
 
 
 def _module_name_from_path(rel_path: Path) -> str:
@@ -234,23 +391,35 @@ def _module_name_from_path(rel_path: Path) -> str:
     
     # If path is just '.', return the original stem
     if str(path_without_suffix) == '.':
-        return rel_path.stem
+        return sys.intern(rel_path.stem)
     
     parts = list(path_without_suffix.parts)
-    return ".".join(parts)
+    # Interned: module names are repeated on every symbol and used as index keys
+    return sys.intern(".".join(parts))
 
 
-def _make_module_symbol(module: str, rel_path: Path, source_lines: List[str]) -> Symbol:
+def _make_module_symbol(
+    module: str,
+    rel_path: Path,
+    source_lines: List[str],
+    source: Optional[str] = None,
+) -> Symbol:
     """
     Create a `module`-kind symbol that represents the file as a whole.
 
-    This gives module-level call sites a valid `caller_id`.
+    This gives module-level call sites a valid `caller_id`. Pass the file's
+    `source` (``"".join(source_lines)``) to reuse it as the snippet.
     """
     name = module.split(".")[-1] if module else ""
     start_line = 1
     end_line = len(source_lines) if source_lines else 1
     # Include snippet for file-level code labels
-    snippet = "".join(source_lines) if source_lines else None
+    if not source_lines:
+        snippet = None
+    elif source is not None:
+        snippet = source
+    else:
+        snippet = "".join(source_lines)
     return Symbol(
         id=module,
         kind="module",
@@ -265,35 +434,91 @@ def _make_module_symbol(module: str, rel_path: Path, source_lines: List[str]) ->
 
 
 # ---------------------------------------------------------------------------
-# Symbol discovery
+# Symbol and call-site discovery
 # ---------------------------------------------------------------------------
 
-class _SymbolVisitor(ast.NodeVisitor):
+# A call site before resolution: (caller_id, location, raw_callee)
+_PendingCall = Tuple[str, SourceLocation, str]
+# One scanned module: (module, module symbol, other symbols, pending calls)
+_ModuleScan = Tuple[str, Symbol, List[Symbol], List[_PendingCall]]
+
+
+class _UnifiedVisitor(ast.NodeVisitor):
     """
-    Traverses an AST and records functions / methods / classes as `Symbol`s.
+    Traverses a module's AST once, recording functions / methods / classes as
+    `Symbol`s and call sites as pending ``(caller_id, location, raw_callee)``
+    entries.
+
+    Callees are turned into dotted strings using the module's imports as they
+    are seen; mapping them to symbol IDs needs every module's symbols, so it
+    happens afterwards in `_resolve_calls`.
     """
 
-    def __init__(self, module: str, rel_path: Path, source_lines: List[str]):
+    def __init__(
+        self,
+        module: str,
+        rel_path: Path,
+        source_lines: List[str],
+        source: Optional[str] = None,
+    ):
         self.module = module
         self.rel_path = rel_path
         self.source_lines = source_lines
+        # Whole file text plus the offset of each line start, so a snippet is
+        # one slice of `_source` (source == "".join(source_lines)).
+        self._source = "".join(source_lines) if source is None else source
+        self._line_starts: List[int] = [0]
+        offset = 0
+        for line in source_lines:
+            offset += len(line)
+            self._line_starts.append(offset)
+
         self.symbols: List[Symbol] = []
-        self._qualname_stack: List[str] = []
+        self.pending_calls: List[_PendingCall] = []
+        self._ctx_stack: List[str] = []  # nested class / function names
         self._class_attributes: Dict[str, List[Tuple[str, int, int]]] = {}  # class_qualname -> [(attr_name, lineno, end_lineno)]
         self._in_function_depth: int = 0  # Track if we're inside a function/method
+        self._import_aliases: Dict[str, str] = {}  # local_name -> fully qualified target
 
-    # --- helpers ---------------------------------------------------------
+        # Exact-type dispatch table, bound once, instead of NodeVisitor's
+        # per-node getattr("visit_" + class name).
+        self._dispatch = {
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.AsyncFunctionDef: self.visit_AsyncFunctionDef,
+            ast.ClassDef: self.visit_ClassDef,
+            ast.AnnAssign: self.visit_AnnAssign,
+            ast.Import: self.visit_Import,
+            ast.ImportFrom: self.visit_ImportFrom,
+            ast.Call: self.visit_Call,
+        }
 
-    def _push(self, name: str) -> None:
-        self._qualname_stack.append(name)
+    def visit(self, node: ast.AST) -> None:
+        handler = self._dispatch.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(node)
 
-    def _pop(self) -> None:
-        self._qualname_stack.pop()
+    def generic_visit(self, node: ast.AST) -> None:
+        visit = self.visit
+        for child in ast.iter_child_nodes(node):
+            visit(child)
+
+    # --- helpers ---------------------------------------------------------
 
     def _current_qualname(self, name: str) -> str:
-        if self._qualname_stack:
-            return ".".join([self.module, *self._qualname_stack, name])
-        return ".".join([self.module, name])
+        return sys.intern(".".join([self.module, *self._ctx_stack, name]))
+
+    def _current_caller_id(self) -> str:
+        """
+        ID of the current caller.
+
+        - If inside a function/method/class, use `module.qualname`.
+        - Otherwise, use the module symbol ID (module name itself).
+        """
+        if self._ctx_stack:
+            return sys.intern(".".join([self.module, *self._ctx_stack]))
+        return self.module  # module-level calls
 
     def _add_symbol(self, node: ast.AST, kind: SymbolKind, name: str) -> None:
         qualname = self._current_qualname(name)
@@ -320,39 +545,41 @@ class _SymbolVisitor(ast.NodeVisitor):
         # Clamp to available lines
         start = max(1, start)
         end = min(len(self.source_lines), end)
-        return "".join(self.source_lines[start - 1 : end])
+        if end < start:
+            return ""
+        return self._source[self._line_starts[start - 1] : self._line_starts[end]]
 
-    # --- visitors --------------------------------------------------------
+    # --- definitions -----------------------------------------------------
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        kind: SymbolKind = "function" if not self._qualname_stack else "method"
+        kind: SymbolKind = "function" if not self._ctx_stack else "method"
         self._add_symbol(node, kind=kind, name=node.name)
-        self._push(node.name)
+        self._ctx_stack.append(node.name)
         self._in_function_depth += 1
         self.generic_visit(node)
         self._in_function_depth -= 1
-        self._pop()
+        self._ctx_stack.pop()
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        kind: SymbolKind = "function" if not self._qualname_stack else "method"
+        kind: SymbolKind = "function" if not self._ctx_stack else "method"
         self._add_symbol(node, kind=kind, name=node.name)
-        self._push(node.name)
+        self._ctx_stack.append(node.name)
         self._in_function_depth += 1
         self.generic_visit(node)
         self._in_function_depth -= 1
-        self._pop()
+        self._ctx_stack.pop()
 
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         self._add_symbol(node, kind="class", name=node.name)
-        self._push(node.name)
+        self._ctx_stack.append(node.name)
         self.generic_visit(node)
-        self._pop()
+        self._ctx_stack.pop()
 
     def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
         """Track annotated assignments (class attributes with type hints)."""
         # Only track if we're directly inside a class (not in a method/function)
-        if self._qualname_stack and self._in_function_depth == 0 and isinstance(node.target, ast.Name):
-            class_qualname = ".".join([self.module, *self._qualname_stack])
+        if self._ctx_stack and self._in_function_depth == 0 and isinstance(node.target, ast.Name):
+            class_qualname = ".".join([self.module, *self._ctx_stack])
             attr_name = node.target.id
             lineno = getattr(node, "lineno", 1)
             end_lineno = getattr(node, "end_lineno", lineno)
@@ -361,17 +588,74 @@ class _SymbolVisitor(ast.NodeVisitor):
             self._class_attributes[class_qualname].append((attr_name, lineno, end_lineno))
         self.generic_visit(node)
 
+    # --- import handling -------------------------------------------------
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.asname:
+                local = alias.asname
+                target = alias.name
+            else:
+                # e.g. `import pkg.sub` binds `pkg`
+                first = alias.name.split(".", 1)[0]
+                local = first
+                target = first
+            self._import_aliases[local] = target
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        module = node.module or ""
+        for alias in node.names:
+            if alias.asname:
+                local = alias.asname
+            else:
+                local = alias.name
+            if module:
+                target = f"{module}.{alias.name}"
+            else:
+                # relative import without explicit module - we keep just the name
+                target = alias.name
+            self._import_aliases[local] = target
+        self.generic_visit(node)
+
+    # --- call sites ------------------------------------------------------
+
+    def visit_Call(self, node: ast.Call) -> None:
+        location = SourceLocation(
+            file=self.rel_path,
+            lineno=getattr(node, "lineno", 1),
+            col_offset=getattr(node, "col_offset", 0),
+        )
+
+        raw = _format_callee_expr(node.func, import_aliases=self._import_aliases)
+        if raw is None:
+            raw = "<unknown>"
+
+        self.pending_calls.append((self._current_caller_id(), location, raw))
+        self.generic_visit(node)
+
 
-def _iter_symbols_from_ast(
+def _scan_module(
     tree: ast.AST,
     module: str,
     rel_path: Path,
-    source_lines: List[str],
-) -> List[Symbol]:
-    visitor = _SymbolVisitor(
+    source: str,
+) -> _ModuleScan:
+    """
+    Collect one module's symbols and unresolved call sites in a single walk.
+
+    Returns ``(module, module_symbol, symbols, pending_calls)``.
+    """
+    # Split once; the module symbol and the visitor share the lines
+    source_lines = source.splitlines(keepends=True)
+    # Module-level symbol for this file
+    module_sym = _make_module_symbol(module, rel_path, source_lines, source)
+
+    visitor = _UnifiedVisitor(
         module=module,
         rel_path=rel_path,
         source_lines=source_lines,
+        source=source,
     )
     visitor.visit(tree)
     
@@ -385,7 +669,7 @@ def _iter_symbols_from_ast(
         start_line = attrs[0][1]
         end_line = attrs[-1][2]
         # Extract snippet containing all attributes
-        snippet = "".join(source_lines[start_line - 1 : end_line])
+        snippet = visitor._extract_snippet(start_line, end_line)
         # Create a single symbol for all attributes of this class
         attr_names = ", ".join(attr[0] for attr in attrs)
         visitor.symbols.append(
@@ -402,7 +686,7 @@ def _iter_symbols_from_ast(
             )
         )
     
-    return visitor.symbols
+    return module, module_sym, visitor.symbols, visitor.pending_calls
 
 
 # ---------------------------------------------------------------------------
@@ -457,116 +741,42 @@ def callsite_graph(project: 'ResolvedProject') -> Dict[str, List[tuple]]:
             edges.append((callsite_id, call.callee_id))
     return {"nodes": nodes, "edges": edges}
 
-class _CallVisitor(ast.NodeVisitor):
+def _resolve_calls(
+    pending_calls: List[_PendingCall],
+    module: str,
+    symbol_index: Dict[Tuple[str, str], List[Symbol]],
+    symbol_index_flat: Dict[str, Symbol],
+    name_index: Optional[Dict[str, List[Symbol]]] = None,
+    resolve_cache: Optional[Dict[Tuple[str, str], Optional[str]]] = None,
+) -> List[Call]:
     """
-    Traverses an AST and records call sites as `Call`s.
+    Turn one module's pending call sites into `Call`s.
 
     It uses a simple static scheme to map callees to symbol IDs:
     - local functions/methods/classes in the same module
     - imported names via `import` / `from ... import ...`
     - attributes where the base is an imported module/alias
-    """
 
-    def __init__(
-        self,
-        module: str,
-        rel_path: Path,
-        symbol_index: Dict[Tuple[str, str], List[Symbol]],
-        symbol_index_flat: Dict[str, Symbol],
-        source_lines: List[str],
-    ):
-        self.module = module
-        self.rel_path = rel_path
-        self.symbol_index = symbol_index
-        self.symbol_index_flat = symbol_index_flat
-        self.source_lines = source_lines
-
-        self.calls: List[Call] = []
-        self._ctx_stack: List[str] = []  # nested class / function names
-        self._import_aliases: Dict[str, str] = {}  # local_name -> fully qualified target
-
-    # --- context helpers -------------------------------------------------
-
-    def _current_caller_id(self) -> str:
-        """
-        ID of the current caller.
-
-        - If inside a function/method/class, use `module.qualname`.
-        - Otherwise, use the module symbol ID (module name itself).
-        """
-        if self._ctx_stack:
-            qual = ".".join([self.module, *self._ctx_stack])
-            return qual
-        return self.module  # module-level calls
-
-    # --- import handling -------------------------------------------------
-
-    def visit_Import(self, node: ast.Import) -> None:
-        for alias in node.names:
-            if alias.asname:
-                local = alias.asname
-                target = alias.name
-            else:
-                # e.g. `import pkg.sub` binds `pkg`
-                first = alias.name.split(".", 1)[0]
-                local = first
-                target = first
-            self._import_aliases[local] = target
-        self.generic_visit(node)
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
-        module = node.module or ""
-        for alias in node.names:
-            if alias.asname:
-                local = alias.asname
-            else:
-                local = alias.name
-            if module:
-                target = f"{module}.{alias.name}"
-            else:
-                # relative import without explicit module - we keep just the name
-                target = alias.name
-            self._import_aliases[local] = target
-        self.generic_visit(node)
-
-    # --- definition nesting ---------------------------------------------
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        self._ctx_stack.append(node.name)
-        self.generic_visit(node)
-        self._ctx_stack.pop()
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        self._ctx_stack.append(node.name)
-        self.generic_visit(node)
-        self._ctx_stack.pop()
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        self._ctx_stack.append(node.name)
-        self.generic_visit(node)
-        self._ctx_stack.pop()
-
-    # --- call sites ------------------------------------------------------
-
-    def visit_Call(self, node: ast.Call) -> None:
-        caller_id = self._current_caller_id()
-        location = SourceLocation(
-            file=self.rel_path,
-            lineno=getattr(node, "lineno", 1),
-            col_offset=getattr(node, "col_offset", 0),
-        )
-
-        raw = _format_callee_expr(node.func, import_aliases=self._import_aliases)
-        if raw is None:
-            raw = "<unknown>"
+    `resolve_cache` maps ``(raw_callee, module)`` to the resolved ID and may be
+    shared by every module resolved against the same symbol index.
+    """
+    if resolve_cache is None:
+        resolve_cache = {}
 
-        callee_id = _resolve_callee_id(
-            raw_callee=raw,
-            current_module=self.module,
-            symbol_index=self.symbol_index,
-        )
+    calls: List[Call] = []
+    for caller_id, location, raw in pending_calls:
+        cache_key = (raw, module)
+        try:
+            callee_id = resolve_cache[cache_key]
+        except KeyError:
+            callee_id = resolve_cache[cache_key] = _resolve_callee_id(
+                raw_callee=raw,
+                current_module=module,
+                symbol_index=symbol_index,
+                name_index=name_index,
+            )
 
-        self.calls.append(
+        calls.append(
             Call(
                 caller_id=caller_id,
                 location=location,
@@ -577,11 +787,11 @@ class _CallVisitor(ast.NodeVisitor):
 
         # If the call target is a class, also record a call to its __init__
         if callee_id is not None:
-            sym = self.symbol_index_flat.get(callee_id)
+            sym = symbol_index_flat.get(callee_id)
             if sym and sym.kind == "class":
                 init_id = f"{callee_id}.__init__"
-                if init_id in self.symbol_index_flat:
-                    self.calls.append(
+                if init_id in symbol_index_flat:
+                    calls.append(
                         Call(
                             caller_id=caller_id,
                             location=location,
@@ -590,7 +800,7 @@ class _CallVisitor(ast.NodeVisitor):
                         )
                     )
 
-        self.generic_visit(node)
+    return calls
 
 
 def _build_symbol_index(symbols: Dict[str, Symbol]) -> Dict[Tuple[str, str], List[Symbol]]:
@@ -606,6 +816,19 @@ def _build_symbol_index(symbols: Dict[str, Symbol]) -> Dict[Tuple[str, str], Lis
     return dict(index)
 
 
+def _build_name_index(
+    symbol_index: Dict[Tuple[str, str], List[Symbol]],
+) -> Dict[str, List[Symbol]]:
+    """
+    Regroup a `_build_symbol_index` result by bare name:
+    name -> [Symbol, ...] across all modules
+    """
+    index: DefaultDict[str, List[Symbol]] = defaultdict(list)
+    for (_, name), syms in symbol_index.items():
+        index[name].extend(syms)
+    return dict(index)
+
+
 def _format_callee_expr(
     expr: ast.AST,
     import_aliases: Dict[str, str],
@@ -621,26 +844,31 @@ def _format_callee_expr(
 
     Returns None if the expression is too dynamic to represent.
     """
-    if isinstance(expr, ast.Name):
-        name = expr.id
-        if name in import_aliases:
-            return import_aliases[name]
-        return name
-
-    if isinstance(expr, ast.Attribute):
-        base = _format_callee_expr(expr.value, import_aliases=import_aliases)
-        if base is None:
-            return None
-        return f"{base}.{expr.attr}"
+    # Walk down the attribute chain (`a.b.c` -> ["c", "b"], base `a`)
+    # iteratively and join once, instead of recursing per segment.
+    attrs: List[str] = []
+    while isinstance(expr, ast.Attribute):
+        attrs.append(expr.attr)
+        expr = expr.value
+
+    if not isinstance(expr, ast.Name):
+        # More dynamic / complex call target (e.g., indexing, lambda, etc.)
+        return None
 
-    # More dynamic / complex call target (e.g., indexing, lambda, etc.)
-    return None
+    name = expr.id
+    base = import_aliases.get(name, name)
+    if not attrs:
+        return base
+    attrs.append(base)
+    attrs.reverse()
+    return ".".join(attrs)
 
 
 def _resolve_callee_id(
     raw_callee: str,
     current_module: str,
     symbol_index: Dict[Tuple[str, str], List[Symbol]],
+    name_index: Optional[Dict[str, List[Symbol]]] = None,
 ) -> Optional[str]:
     """
     Heuristically resolve a raw callee name to a Symbol ID.
@@ -650,6 +878,9 @@ def _resolve_callee_id(
     2. Otherwise, treat it as a bare name and look in the current module.
     3. As a last resort, if there's exactly one symbol with that name across all
        modules, use it.
+
+    `name_index` (from `_build_name_index`) makes step 3 a single lookup; if
+    omitted, `symbol_index` is scanned.
     """
     if raw_callee == "<unknown>":
         return None
@@ -673,10 +904,13 @@ def _resolve_callee_id(
             return _pick_best_symbol(candidates).id
 
     # Last resort: global name match (only if unique)
-    global_matches: List[Symbol] = []
-    for (mod, n), syms in symbol_index.items():
-        if n == name:
-            global_matches.extend(syms)
+    if name_index is not None:
+        global_matches = name_index.get(name, [])
+    else:
+        global_matches = []
+        for (mod, n), syms in symbol_index.items():
+            if n == name:
+                global_matches.extend(syms)
 
     if len(global_matches) == 1:
         return global_matches[0].id
@@ -684,15 +918,18 @@ def _resolve_callee_id(
     return None
 
 
+# Lower ranks win in `_pick_best_symbol`; unlisted kinds rank 1.
+_KIND_RANK: Dict[str, int] = {"function": 0, "method": 0}
+
+
 def _pick_best_symbol(candidates: List[Symbol]) -> Symbol:
     """
     Pick the "best" symbol if multiple share the same (module, name).
 
     For now:
     - prefer functions/methods over classes (slightly arbitrary, but reasonable)
+    - otherwise keep the first candidate (``min`` returns the first lowest rank)
     """
-    func_kinds = ("function", "method")
-    func_like = [s for s in candidates if s.kind in func_kinds]
-    if func_like:
-        return func_like[0]
-    return candidates[0]
+    if len(candidates) == 1:
+        return candidates[0]
+    return min(candidates, key=lambda s: _KIND_RANK.get(s.kind, 1))
@@ -0,0 +1,208 @@
+import hashlib
+import textwrap
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import pytest
+
+from helpers import write_py
+
+# Import the package modules once at collection time so the first test that
+# calls into them does not pay the import cost.
+import pycodemap.cli  # noqa: F401
+import pycodemap.graph  # noqa: F401
+import pycodemap.renderer  # noqa: F401
+import pycodemap.resolver  # noqa: F401
+from pycodemap.graph import CallGraph, GraphConfig, build_call_graph
+from pycodemap.resolver import ResolvedProject, resolve_project, resolve_source
+
+
+@pytest.fixture
+def svg_sink(monkeypatch) -> Dict[Path, str]:
+    """
+    Replace the CLI's SVG writer with an in-memory sink.
+
+    Maps each output path to ``"<svg>{dot}</svg>"`` instead of running
+    Graphviz and writing the file. Use this for any renderer-output test.
+    """
+    sink: Dict[Path, str] = {}
+    monkeypatch.setattr(
+        "pycodemap.cli.write_svg",
+        lambda dot, path: sink.__setitem__(path, f"<svg>{dot}</svg>"),
+    )
+    return sink
+
+
+@pytest.fixture(scope="session")
+def build_cached() -> Callable[..., CallGraph]:
+    """
+    Build (and memoize) the call graph for a single-module source text.
+
+    ``build_cached(src, cfg, module="mod")`` resolves `src` in memory as the
+    dotted ``module`` with ``resolve_source`` and builds the graph for `cfg`.
+    Identical inputs share one project and one graph for the whole session,
+    so callers must treat the results as read-only.
+    """
+    projects: Dict[str, ResolvedProject] = {}
+    graphs: Dict[Tuple[str, GraphConfig], CallGraph] = {}
+
+    def _build(src: str, cfg: GraphConfig, module: str = "mod") -> CallGraph:
+        src_key = hashlib.blake2b(f"{module}\0{src}".encode("utf-8")).hexdigest()
+        graph_key = (src_key, cfg)
+        graph = graphs.get(graph_key)
+        if graph is not None:
+            return graph
+
+        project = projects.get(src_key)
+        if project is None:
+            project = projects[src_key] = resolve_source(module, src)
+
+        graph = graphs[graph_key] = build_call_graph(project, cfg)
+        return graph
+
+    return _build
+
+
+@pytest.fixture(scope="session")
+def resolve_cached() -> Callable[[str, str], ResolvedProject]:
+    """
+    Resolve (and memoize) a single module named `module_name` with `src`.
+
+    ``resolve_cached(module_name, src)`` resolves the text in memory with
+    ``resolve_source``, as if it were ``<module_name>.py``. Identical inputs
+    share one project for the whole session, so callers must treat it as
+    read-only.
+    """
+    cache: Dict[Tuple[str, str], ResolvedProject] = {}
+
+    def _resolve(module_name: str, src: str) -> ResolvedProject:
+        key = (module_name, src)
+        project = cache.get(key)
+        if project is None:
+            project = cache[key] = resolve_source(module_name, src)
+        return project
+
+    return _resolve
+
+
+# Canonical single-file sources, written once per session by `fixture_files`.
+SINGLE_FILE_SOURCES: Dict[str, str] = {
+    "script": (
+        "def hello():\n"
+        "    print('Hello')\n"
+        "\n"
+        "hello()\n"
+    ),
+    "main": (
+        "import os\n"
+        "\n"
+        "def check_file(path):\n"
+        "    return os.path.exists(path)\n"
+        "\n"
+        "check_file('test.txt')\n"
+    ),
+    "calculator": (
+        "class Calculator:\n"
+        "    def add(self, a, b):\n"
+        "        return a + b\n"
+        "\n"
+        "    def subtract(self, a, b):\n"
+        "        return a - b\n"
+        "\n"
+        "calc = Calculator()\n"
+        "result = calc.add(1, 2)\n"
+    ),
+    "nested": (
+        "def outer():\n"
+        "    def inner():\n"
+        "        return 42\n"
+        "    return inner()\n"
+        "\n"
+        "outer()\n"
+    ),
+    "comments": (
+        '"""Module docstring."""\n'
+        "# This is a comment\n"
+        "# Another comment\n"
+    ),
+    "empty": "",
+    "simple": (
+        "def foo():\n"
+        "    bar()\n"
+        "\n"
+        "def bar():\n"
+        "    pass\n"
+        "\n"
+        "foo()\n"
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def fixture_files(tmp_path_factory) -> Dict[str, Path]:
+    """
+    Paths to ``<name>.py`` files for every entry in ``SINGLE_FILE_SOURCES``.
+
+    All files are written once per session into one directory; tests resolve
+    them individually with ``resolve_project(fixture_files[name])``.
+    """
+    root = tmp_path_factory.mktemp("fixtures")
+    paths: Dict[str, Path] = {}
+    for name, src in SINGLE_FILE_SOURCES.items():
+        path = paths[name] = root / f"{name}.py"
+        write_py(path, src)
+    return paths
+
+
+SHARED_MODULE_SRC = textwrap.dedent(
+    """
+    def process():
+        return 1
+
+    def process_data():
+        return 2
+
+    def calculate():
+        return 3
+
+    def helper():
+        return 4
+    """
+)
+
+
+@pytest.fixture(scope="module")
+def project_factory(tmp_path_factory) -> Callable[[str, Dict[str, str]], ResolvedProject]:
+    """
+    Write and resolve (once per test module) a named multi-file project.
+
+    ``project_factory(name, files)`` writes each ``files`` entry (relative
+    path -> source) into a fresh directory on first use of ``name`` and
+    returns ``resolve_project`` for it; later calls with the same ``name``
+    return that project. Tests that only vary CLI arguments share it, so
+    they must not mutate the result.
+    """
+    projects: Dict[str, ResolvedProject] = {}
+
+    def _get(name: str, files: Dict[str, str]) -> ResolvedProject:
+        project = projects.get(name)
+        if project is None:
+            root = tmp_path_factory.mktemp(name)
+            for filename, data in files.items():
+                write_py(root / filename, data)
+            project = projects[name] = resolve_project(root)
+        return project
+
+    return _get
+
+
+@pytest.fixture(scope="module")
+def shared_project(project_factory) -> ResolvedProject:
+    """
+    Resolved project for a standard ``mod.py`` with unrelated functions
+    (``process``, ``process_data``, ``calculate``, ``helper``).
+
+    Written and resolved once per test module; tests that only vary CLI
+    arguments render from it with ``pycodemap.cli._render_from_project``.
+    """
+    return project_factory("shared_project", {"mod.py": SHARED_MODULE_SRC})
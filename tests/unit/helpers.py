@@ -0,0 +1,70 @@
+"""Shared assertion helpers for the unit tests."""
+import os
+import re
+from pathlib import Path
+from typing import Any, AnyStr, Dict, Iterable, Optional, Union
+
+
+def write_py(path: Path, data: Union[str, bytes]) -> None:
+    """Write a source file with one open/write/close, encoding str as UTF-8."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def assert_symbols(
+    data: Dict[str, Any],
+    included: Iterable[str] = (),
+    excluded: Iterable[str] = (),
+    kinds: Optional[Iterable[str]] = ("function", "method"),
+) -> None:
+    """
+    Check the symbol names in CLI JSON output in one pass.
+
+    Every name in `included` must be present and none of `excluded` may be,
+    considering only symbols whose kind is in `kinds` (all symbols if None).
+    """
+    if kinds is None:
+        names = {s["name"] for s in data["symbols"]}
+    else:
+        kinds = set(kinds)
+        names = {s["name"] for s in data["symbols"] if s["kind"] in kinds}
+    missing = set(included) - names
+    extra = set(excluded) & names
+    assert not missing and not extra, (missing, extra)
+
+
+def assert_in_output(
+    content: AnyStr,
+    included: Iterable[AnyStr] = (),
+    excluded: Iterable[AnyStr] = (),
+) -> None:
+    """
+    Check that rendered output contains every `included` substring and none
+    of the `excluded` ones, scanning `content` once for all of them.
+
+    Works on either str or bytes, as long as the needles have the same type.
+    """
+    included, excluded = list(included), list(excluded)
+    needles = sorted({*included, *excluded}, key=len, reverse=True)
+    if not needles:
+        return
+    # Lookahead so matches may overlap; longest first, so only a needle that is
+    # a prefix of another one can be shadowed -- those are checked directly.
+    if isinstance(content, str):
+        pattern = "(?=(%s))" % "|".join(map(re.escape, needles))
+    else:
+        pattern = b"(?=(%s))" % b"|".join(map(re.escape, needles))
+    hits = set(re.findall(pattern, content))
+    for needle in needles:
+        if needle not in hits and any(o != needle and o.startswith(needle) for o in needles):
+            if needle in content:
+                hits.add(needle)
+    missing = [n for n in included if n not in hits]
+    extra = [n for n in excluded if n in hits]
+    # Show the start of the output so a failure can be diagnosed from the report
+    assert not missing and not extra, f"missing={missing!r} extra={extra!r}; got: {content[:400]!r}"
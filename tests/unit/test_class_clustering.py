@@ -1,60 +1,106 @@
 """
 Test for class-based clustering with --node-type function --show-module.
 """
-import tempfile
 from pathlib import Path
 
-from pycodemap.resolver import resolve_project, ResolverConfig
+import pytest
+
+from pycodemap.resolver import resolve_project
 from pycodemap.graph import GraphConfig, build_call_graph
 from pycodemap.renderer import RendererConfig, build_dot
 
 
-def test_methods_clustered_by_class(tmp_path: Path) -> None:
-    """
-    When using --node-type function with cluster_by_module=True,
-    methods should be grouped within their containing class cluster.
-    """
-    
-    src = tmp_path / "service.py"
-    src.write_text(
-        "class DataService:\n"
-        "    def load(self):\n"
-        "        return self.parse()\n"
-        "\n"
-        "    def parse(self):\n"
-        "        return {}\n"
-        "\n"
-        "    def save(self, data):\n"
-        "        pass\n"
-        "\n"
-        "def helper():\n"
-        "    svc = DataService()\n"
-        "    return svc.load()\n",
-        encoding="utf-8",
-    )
-    
+SERVICE_SRC = (
+    "class DataService:\n"
+    "    def load(self):\n"
+    "        return self.parse()\n"
+    "\n"
+    "    def parse(self):\n"
+    "        return {}\n"
+    "\n"
+    "    def save(self, data):\n"
+    "        pass\n"
+    "\n"
+    "def helper():\n"
+    "    svc = DataService()\n"
+    "    return svc.load()\n"
+)
+
+NESTED_SRC = (
+    "class Outer:\n"
+    "    class Inner:\n"
+    "        def method_a(self):\n"
+    "            return 1\n"
+    "\n"
+    "        def method_b(self):\n"
+    "            return 2\n"
+    "\n"
+    "    def outer_method(self):\n"
+    "        return 3\n"
+)
+
+PLAIN_SRC = (
+    "class Widget:\n"
+    "    def render(self):\n"
+    "        pass\n"
+)
+
+
+@pytest.mark.parametrize(
+    "filename, source, cluster_by_module, expected_clusters",
+    [
+        # Methods are grouped within their containing class cluster;
+        # top-level functions are clustered by module.
+        (
+            "service.py",
+            SERVICE_SRC,
+            True,
+            {
+                "service.DataService.load": "service.DataService",
+                "service.DataService.parse": "service.DataService",
+                "service.DataService.save": "service.DataService",
+                "service.helper": "service",
+            },
+        ),
+        # Nested class methods are clustered by their immediate class.
+        (
+            "nested.py",
+            NESTED_SRC,
+            True,
+            {
+                "nested.Outer.Inner.method_a": "nested.Outer.Inner",
+                "nested.Outer.Inner.method_b": "nested.Outer.Inner",
+                "nested.Outer.outer_method": "nested.Outer",
+            },
+        ),
+        # When cluster_by_module=False, methods are not grouped into clusters.
+        (
+            "plain.py",
+            PLAIN_SRC,
+            False,
+            {"plain.Widget.render": None},
+        ),
+    ],
+)
+def test_node_clusters(
+    tmp_path: Path,
+    filename: str,
+    source: str,
+    cluster_by_module: bool,
+    expected_clusters: dict,
+) -> None:
+    """Each node's cluster follows its containing class, module, or is unset."""
+    src = tmp_path / filename
+    src.write_text(source, encoding="utf-8")
+
     project = resolve_project(src)
-    graph_cfg = GraphConfig(node_granularity="function", cluster_by_module=True)
+    graph_cfg = GraphConfig(node_granularity="function", cluster_by_module=cluster_by_module)
     call_graph = build_call_graph(project, graph_cfg)
-    
-    # Check that methods have the class as their cluster
-    load_node = call_graph.nodes.get("service.DataService.load")
-    parse_node = call_graph.nodes.get("service.DataService.parse")
-    save_node = call_graph.nodes.get("service.DataService.save")
-    
-    assert load_node is not None
-    assert parse_node is not None
-    assert save_node is not None
-    
-    # All methods should be clustered under the class qualname
-    assert load_node.cluster == "service.DataService"
-    assert parse_node.cluster == "service.DataService"
-    assert save_node.cluster == "service.DataService"
-    
-    # Top-level function should be clustered by module
-    helper_node = call_graph.nodes.get("service.helper")
-    assert helper_node is not None
-    assert helper_node.cluster == "service"
+
+    for node_id, expected in expected_clusters.items():
+        node = call_graph.nodes.get(node_id)
+        assert node is not None, node_id
+        assert node.cluster == expected, node_id
 
 
 def test_dot_output_contains_class_clusters(tmp_path: Path) -> None:
@@ -87,62 +133,3 @@ def test_dot_output_contains_class_clusters(tmp_path: Path) -> None:
     # Should contain the method nodes
     assert "add" in dot
     assert "subtract" in dot
-
-
-def test_nested_class_methods_clustered(tmp_path: Path) -> None:
-    """Nested class methods should be clustered by their immediate class."""
-    
-    src = tmp_path / "nested.py"
-    src.write_text(
-        "class Outer:\n"
-        "    class Inner:\n"
-        "        def method_a(self):\n"
-        "            return 1\n"
-        "\n"
-        "        def method_b(self):\n"
-        "            return 2\n"
-        "\n"
-        "    def outer_method(self):\n"
-        "        return 3\n",
-        encoding="utf-8",
-    )
-    
-    project = resolve_project(src)
-    graph_cfg = GraphConfig(node_granularity="function", cluster_by_module=True)
-    call_graph = build_call_graph(project, graph_cfg)
-    
-    # Inner class methods should be clustered under Inner
-    method_a = call_graph.nodes.get("nested.Outer.Inner.method_a")
-    method_b = call_graph.nodes.get("nested.Outer.Inner.method_b")
-    
-    assert method_a is not None
-    assert method_b is not None
-    assert method_a.cluster == "nested.Outer.Inner"
-    assert method_b.cluster == "nested.Outer.Inner"
-    
-    # Outer class method should be clustered under Outer
-    outer_method = call_graph.nodes.get("nested.Outer.outer_method")
-    assert outer_method is not None
-    assert outer_method.cluster == "nested.Outer"
-
-
-def test_no_clustering_when_disabled(tmp_path: Path) -> None:
-    """
-    When cluster_by_module=False, methods should not be grouped into clusters.
-    """
-    
-    src = tmp_path / "plain.py"
-    src.write_text(
-        "class Widget:\n"
-        "    def render(self):\n"
-        "        pass\n",
-        encoding="utf-8",
-    )
-    
-    project = resolve_project(src)
-    graph_cfg = GraphConfig(node_granularity="function", cluster_by_module=False)
-    call_graph = build_call_graph(project, graph_cfg)
-    
-    render_node = call_graph.nodes.get("plain.Widget.render")
-    assert render_node is not None
-    assert render_node.cluster is None
@@ -5,10 +5,13 @@ import json
 import pytest
 from pycodemap.cli import main
 
+from helpers import assert_in_output, assert_symbols, write_py
+
 
 def test_filter_basic_single_keyword(tmp_path: Path) -> None:
     """Test --filter with a single keyword filters nodes by name."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def process_data():
@@ -21,7 +24,6 @@ def test_filter_basic_single_keyword(tmp_path: Path) -> None:
                 return 3
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for nodes containing "process"
@@ -32,7 +34,8 @@ def test_filter_basic_single_keyword(tmp_path: Path) -> None:
 
 def test_filter_multiple_keywords_comma_separated(tmp_path: Path, capsys) -> None:
     """Test --filter with comma-separated keywords matches any keyword."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def process_data():
@@ -48,27 +51,27 @@ def test_filter_multiple_keywords_comma_separated(tmp_path: Path, capsys) -> Non
                 return 4
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for nodes containing "process" OR "calculate"
     exit_code = main([str(tmp_path), "--format", "json", "--filter", "process,calculate"])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
     # Should include process_data and calculate_total, but not show_result or helper
-    symbol_names = [s["name"] for s in data["symbols"]]
-    assert "process_data" in symbol_names
-    assert "calculate_total" in symbol_names
-    assert "show_result" not in symbol_names
-    assert "helper" not in symbol_names
+    assert_symbols(
+        data,
+        included=["process_data", "calculate_total"],
+        excluded=["show_result", "helper"],
+        kinds=None,
+    )
 
 
 def test_filter_with_no_matches(tmp_path: Path, capsys) -> None:
     """Test --filter with keyword that matches no nodes."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def foo():
@@ -78,15 +81,13 @@ def test_filter_with_no_matches(tmp_path: Path, capsys) -> None:
                 return 2
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for nodes containing "nonexistent"
     exit_code = main([str(tmp_path), "--format", "json", "--filter", "nonexistent"])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
     # Should have no symbols (except possibly module)
     function_symbols = [s for s in data["symbols"] if s["kind"] in ("function", "method")]
@@ -95,7 +96,8 @@ def test_filter_with_no_matches(tmp_path: Path, capsys) -> None:
 
 def test_filter_partial_match(tmp_path: Path, capsys) -> None:
     """Test --filter matches partial names (contains, not exact match)."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def process_data():
@@ -108,25 +110,21 @@ def test_filter_partial_match(tmp_path: Path, capsys) -> None:
                 return 3
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for nodes containing "process" - should match both process_data and preprocess_input
     exit_code = main([str(tmp_path), "--format", "json", "--filter", "process"])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
-    symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
-    assert "process_data" in symbol_names
-    assert "preprocess_input" in symbol_names
-    assert "calculate" not in symbol_names
+    assert_symbols(data, included=["process_data", "preprocess_input"], excluded=["calculate"])
 
 
 def test_filter_case_sensitivity(tmp_path: Path, capsys) -> None:
     """Test --filter keyword matching is case-sensitive by default."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def ProcessData():
@@ -139,27 +137,21 @@ def test_filter_case_sensitivity(tmp_path: Path, capsys) -> None:
                 return 3
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for nodes containing lowercase "process"
     exit_code = main([str(tmp_path), "--format", "json", "--filter", "process"])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
-    symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
-    # Should only match process_data (lowercase)
-    assert "process_data" in symbol_names
-    # Should not match ProcessData or PROCESS_DATA
-    assert "ProcessData" not in symbol_names
-    assert "PROCESS_DATA" not in symbol_names
+    assert_symbols(data, included=["process_data"], excluded=["ProcessData", "PROCESS_DATA"])
 
 
 def test_filter_with_methods_in_classes(tmp_path: Path, capsys) -> None:
     """Test --filter works with methods in classes."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             class DataProcessor:
@@ -173,25 +165,21 @@ def test_filter_with_methods_in_classes(tmp_path: Path, capsys) -> None:
                 return 3
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for nodes containing "process"
     exit_code = main([str(tmp_path), "--format", "json", "--filter", "process"])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
-    symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
-    assert "process" in symbol_names  # method
-    assert "process_input" in symbol_names  # function
-    assert "validate" not in symbol_names
+    assert_symbols(data, included=["process", "process_input"], excluded=["validate"])
 
 
 def test_filter_with_attributes(tmp_path: Path, capsys) -> None:
     """Test --filter works with class attributes node."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             class Person:
@@ -205,25 +193,21 @@ def test_filter_with_attributes(tmp_path: Path, capsys) -> None:
                 return 1
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for nodes containing "attributes" - should match the <attributes> node
     exit_code = main([str(tmp_path), "--format", "json", "--filter", "attributes"])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
-    symbol_names = [s["name"] for s in data["symbols"]]
-    assert "<attributes>" in symbol_names
-    assert "greet" not in symbol_names
-    assert "process" not in symbol_names
+    assert_symbols(data, included=["<attributes>"], excluded=["greet", "process"], kinds=None)
 
 
 def test_filter_with_dot_output(tmp_path: Path) -> None:
     """Test --filter works with DOT format output."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def process():
@@ -236,7 +220,6 @@ def test_filter_with_dot_output(tmp_path: Path) -> None:
                 return 2
             """
         ),
-        encoding="utf-8",
     )
     
     output = tmp_path / "filtered.dot"
@@ -250,20 +233,13 @@ def test_filter_with_dot_output(tmp_path: Path) -> None:
     assert exit_code == 0
     assert output.exists()
     
-    content = output.read_text(encoding="utf-8")
-    assert "process" in content
-    assert "unrelated" not in content
+    assert_in_output(output.read_bytes(), included=[b"process"], excluded=[b"unrelated"])
 
 
-def test_filter_with_svg_output(tmp_path: Path, monkeypatch) -> None:
+def test_filter_with_svg_output(tmp_path: Path, svg_sink) -> None:
     """Test --filter works with SVG format output."""
-    # Mock Graphviz to avoid dependency in tests
-    def mock_write_svg(dot: str, output: Path) -> None:
-        output.write_text(f"<svg>{dot}</svg>", encoding="utf-8")
-    
-    monkeypatch.setattr("pycodemap.cli.write_svg", mock_write_svg)
-    
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def process():
@@ -273,7 +249,6 @@ def test_filter_with_svg_output(tmp_path: Path, monkeypatch) -> None:
                 return 2
             """
         ),
-        encoding="utf-8",
     )
     
     output = tmp_path / "filtered.svg"
@@ -285,16 +260,17 @@ def test_filter_with_svg_output(tmp_path: Path, monkeypatch) -> None:
     ])
     
     assert exit_code == 0
-    assert output.exists()
+    assert output in svg_sink
     
-    content = output.read_text(encoding="utf-8")
+    content = svg_sink[output]
     assert "process" in content
     assert "calculate" not in content
 
 
 def test_link_by_filter_without_filter_is_noop(tmp_path: Path, capsys) -> None:
     """Test --link-by-filter has no effect when --filter is not used."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def foo():
@@ -304,25 +280,22 @@ def test_link_by_filter_without_filter_is_noop(tmp_path: Path, capsys) -> None:
                 return 1
             """
         ),
-        encoding="utf-8",
     )
     
     # Using --link-by-filter without --filter should show all nodes (no filtering)
     exit_code = main([str(tmp_path), "--format", "json", "--link-by-filter"])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
     # Should include all functions since no filter is applied
-    symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
-    assert "foo" in symbol_names
-    assert "bar" in symbol_names
+    assert_symbols(data, included=["foo", "bar"])
 
 
 def test_link_by_filter_includes_callees(tmp_path: Path, capsys) -> None:
     """Test --link-by-filter keeps nodes that are called by filtered nodes."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def process():
@@ -339,7 +312,6 @@ def test_link_by_filter_includes_callees(tmp_path: Path, capsys) -> None:
                 return 3
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for "process" with link-by-filter
@@ -351,21 +323,17 @@ def test_link_by_filter_includes_callees(tmp_path: Path, capsys) -> None:
         "--filter", "process",
         "--link-by-filter"
     ])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
-    symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
-    assert "process" in symbol_names  # matched by filter
-    assert "helper" in symbol_names  # called by process
-    assert "calculate" in symbol_names  # called by process
-    assert "unrelated" not in symbol_names  # not called by process
+    assert_symbols(data, included=["process", "helper", "calculate"], excluded=["unrelated"])
 
 
 def test_link_by_filter_transitive_calls(tmp_path: Path, capsys) -> None:
     """Test --link-by-filter includes transitively called nodes."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def process():
@@ -384,7 +352,6 @@ def test_link_by_filter_transitive_calls(tmp_path: Path, capsys) -> None:
                 return 2
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for "process" with link-by-filter
@@ -395,22 +362,17 @@ def test_link_by_filter_transitive_calls(tmp_path: Path, capsys) -> None:
         "--filter", "process",
         "--link-by-filter"
     ])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
-    symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
-    assert "process" in symbol_names
-    assert "level1" in symbol_names
-    assert "level2" in symbol_names
-    assert "level3" in symbol_names
-    assert "unrelated" not in symbol_names
+    assert_symbols(data, included=["process", "level1", "level2", "level3"], excluded=["unrelated"])
 
 
 def test_link_by_filter_multiple_filtered_nodes(tmp_path: Path, capsys) -> None:
     """Test --link-by-filter with multiple nodes matching filter."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def process_data():
@@ -432,7 +394,6 @@ def test_link_by_filter_multiple_filtered_nodes(tmp_path: Path, capsys) -> None:
                 return 2
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for "process" - matches both process_data and process_input
@@ -443,23 +404,21 @@ def test_link_by_filter_multiple_filtered_nodes(tmp_path: Path, capsys) -> None:
         "--filter", "process",
         "--link-by-filter"
     ])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
-    symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
-    assert "process_data" in symbol_names
-    assert "process_input" in symbol_names
-    assert "helper1" in symbol_names
-    assert "helper2" in symbol_names
-    assert "common" in symbol_names
-    assert "unrelated" not in symbol_names
+    assert_symbols(
+        data,
+        included=["process_data", "process_input", "helper1", "helper2", "common"],
+        excluded=["unrelated"],
+    )
 
 
 def test_link_by_filter_with_no_outgoing_calls(tmp_path: Path, capsys) -> None:
     """Test --link-by-filter when filtered node has no outgoing calls."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def process():
@@ -469,7 +428,6 @@ def test_link_by_filter_with_no_outgoing_calls(tmp_path: Path, capsys) -> None:
                 return 2
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for "process" which doesn't call anything
@@ -480,19 +438,17 @@ def test_link_by_filter_with_no_outgoing_calls(tmp_path: Path, capsys) -> None:
         "--filter", "process",
         "--link-by-filter"
     ])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
-    symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
-    assert "process" in symbol_names
-    assert "helper" not in symbol_names
+    assert_symbols(data, included=["process"], excluded=["helper"])
 
 
 def test_link_by_filter_with_circular_calls(tmp_path: Path, capsys) -> None:
     """Test --link-by-filter handles circular call relationships."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def process():
@@ -508,7 +464,6 @@ def test_link_by_filter_with_circular_calls(tmp_path: Path, capsys) -> None:
                 return 1
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for "process" with circular calls
@@ -518,21 +473,17 @@ def test_link_by_filter_with_circular_calls(tmp_path: Path, capsys) -> None:
         "--filter", "process",
         "--link-by-filter"
     ])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
-    symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
-    assert "process" in symbol_names
-    assert "foo" in symbol_names
-    assert "bar" in symbol_names
-    assert "unrelated" not in symbol_names
+    assert_symbols(data, included=["process", "foo", "bar"], excluded=["unrelated"])
 
 
 def test_link_by_filter_with_file_granularity(tmp_path: Path, capsys) -> None:
     """Test --link-by-filter works with --node-type file."""
-    (tmp_path / "process.py").write_text(
+    write_py(
+        tmp_path / "process.py",
         textwrap.dedent(
             """
             from helper import help_func
@@ -541,27 +492,26 @@ def test_link_by_filter_with_file_granularity(tmp_path: Path, capsys) -> None:
                 help_func()
             """
         ),
-        encoding="utf-8",
     )
     
-    (tmp_path / "helper.py").write_text(
+    write_py(
+        tmp_path / "helper.py",
         textwrap.dedent(
             """
             def help_func():
                 return 1
             """
         ),
-        encoding="utf-8",
     )
     
-    (tmp_path / "unrelated.py").write_text(
+    write_py(
+        tmp_path / "unrelated.py",
         textwrap.dedent(
             """
             def other():
                 return 2
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for files containing "process"
@@ -572,10 +522,9 @@ def test_link_by_filter_with_file_granularity(tmp_path: Path, capsys) -> None:
         "--filter", "process",
         "--link-by-filter"
     ])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
     # Should include process.py (matched) and helper.py (called)
     # Should NOT include unrelated.py
@@ -587,7 +536,8 @@ def test_link_by_filter_with_file_granularity(tmp_path: Path, capsys) -> None:
 
 def test_filter_with_whitespace_in_keywords(tmp_path: Path, capsys) -> None:
     """Test --filter handles whitespace around comma-separated keywords."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def process():
@@ -600,40 +550,34 @@ def test_filter_with_whitespace_in_keywords(tmp_path: Path, capsys) -> None:
                 return 3
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter with whitespace: "process, calculate"
     exit_code = main([str(tmp_path), "--format", "json", "--filter", "process, calculate"])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
-    symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
-    assert "process" in symbol_names
-    assert "calculate" in symbol_names
-    assert "helper" not in symbol_names
+    assert_symbols(data, included=["process", "calculate"], excluded=["helper"])
 
 
 def test_filter_empty_string_shows_nothing(tmp_path: Path, capsys) -> None:
     """Test --filter with empty string matches nothing."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def foo():
                 return 1
             """
         ),
-        encoding="utf-8",
     )
     
     # Empty filter string
     exit_code = main([str(tmp_path), "--format", "json", "--filter", ""])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
     function_symbols = [s for s in data["symbols"] if s["kind"] in ("function", "method")]
     assert len(function_symbols) == 0
@@ -641,7 +585,8 @@ def test_filter_empty_string_shows_nothing(tmp_path: Path, capsys) -> None:
 
 def test_link_by_filter_preserves_edges_between_kept_nodes(tmp_path: Path, capsys) -> None:
     """Test --link-by-filter preserves call edges between kept nodes."""
-    (tmp_path / "mod.py").write_text(
+    write_py(
+        tmp_path / "mod.py",
         textwrap.dedent(
             """
             def process():
@@ -660,7 +605,6 @@ def test_link_by_filter_preserves_edges_between_kept_nodes(tmp_path: Path, capsy
                 return 2
             """
         ),
-        encoding="utf-8",
     )
     
     # Filter for "process" with link-by-filter
@@ -670,18 +614,22 @@ def test_link_by_filter_preserves_edges_between_kept_nodes(tmp_path: Path, capsy
         "--filter", "process",
         "--link-by-filter"
     ])
-    captured = capsys.readouterr()
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = json.loads(capsys.readouterr().out)
     
     # Check that calls between kept nodes are preserved
-    calls = data["calls"]
-    caller_callee_pairs = [(c["caller_id"], c["callee_id"]) for c in calls if c["callee_id"]]
+    edges = {(c["caller_id"], c["callee_id"]) for c in data["calls"] if c["callee_id"]}
     
     # Should have process->foo and foo->bar
-    assert any("process" in caller and "foo" in callee for caller, callee in caller_callee_pairs)
-    assert any("foo" in caller and "bar" in callee for caller, callee in caller_callee_pairs)
+    assert ("mod.process", "mod.foo") in edges
+    assert ("mod.foo", "mod.bar") in edges
     
     # Should NOT have unrelated->other
-    assert not any("unrelated" in caller and "other" in callee for caller, callee in caller_callee_pairs)
+    assert ("mod.unrelated", "mod.other") not in edges
+
+
+def test_filter_empty_string_still_rejects_missing_root(tmp_path: Path) -> None:
+    """Test --filter "" skips resolving but still validates the project root."""
+    with pytest.raises(ValueError, match="does not exist"):
+        main([str(tmp_path / "missing"), "--format", "json", "--filter", ""])
@@ -3,98 +3,237 @@ from pathlib import Path
 import textwrap
 import json
 import pytest
-from pycodemap.cli import main
 
-
-def test_filter_combined_with_node_options(tmp_path: Path, capsys) -> None:
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from helpers import assert_in_output, assert_symbols
+from pycodemap.cli import _build_parser, _render_from_project
+
+_loads = orjson.loads if orjson else json.loads
+
+# Module sources are dedented and encoded once at import.
+_SRC_PRUNE_B = textwrap.dedent(
+    """
+    def process():
+        helper()
+        bar()
+
+    def helper():
+        bar()
+
+    def bar():
+        return 1
+    """
+).encode("utf-8")
+
+_SRC_UNDERSCORES_B = textwrap.dedent(
+    """
+    def process_data():
+        return 1
+
+    def __init__():
+        return 2
+
+    def _private_method():
+        return 3
+    """
+).encode("utf-8")
+
+_SRC_PROCESSOR_CLASS_B = textwrap.dedent(
+    """
+    class Processor:
+        def process(self):
+            return 1
+
+    def helper():
+        return 2
+    """
+).encode("utf-8")
+
+_SRC_CALLER_CHAIN_B = textwrap.dedent(
+    """
+    def caller():
+        process()
+
+    def process():
+        helper()
+
+    def helper():
+        return 1
+    """
+).encode("utf-8")
+
+_SRC_PROCESSOR_MODULE_B = textwrap.dedent(
+    """
+    def run():
+        return 1
+    """
+).encode("utf-8")
+
+_SRC_HELPER_MODULE_B = textwrap.dedent(
+    """
+    def assist():
+        return 2
+    """
+).encode("utf-8")
+
+_SRC_UNRESOLVED_B = textwrap.dedent(
+    """
+    def process():
+        unknown_function()  # unresolved call
+        helper()
+
+    def helper():
+        return 1
+    """
+).encode("utf-8")
+
+_SRC_OVERLAPPING_B = textwrap.dedent(
+    """
+    def process_data():
+        return 1
+
+    def data_processor():
+        return 2
+
+    def handler():
+        return 3
+    """
+).encode("utf-8")
+
+_SRC_DIAMOND_B = textwrap.dedent(
+    """
+    def process():
+        left()
+        right()
+
+    def left():
+        bottom()
+
+    def right():
+        bottom()
+
+    def bottom():
+        return 1
+    """
+).encode("utf-8")
+
+_SRC_SELF_CALL_B = textwrap.dedent(
+    """
+    def process():
+        helper()
+        process()  # self-call
+
+    def helper():
+        return 1
+
+    def other():
+        return 2
+    """
+).encode("utf-8")
+
+_SRC_ASYNC_B = textwrap.dedent(
+    """
+    async def process_async():
+        return 1
+
+    async def calculate_async():
+        return 2
+
+    def sync_process():
+        return 3
+    """
+).encode("utf-8")
+
+_SRC_SHARED_CALLEE_B = textwrap.dedent(
+    """
+    def process():
+        shared()
+
+    def calculate():
+        shared()
+
+    def shared():
+        deep()
+
+    def deep():
+        return 1
+    """
+).encode("utf-8")
+
+
+# Files of each named test project, resolved lazily by the filter_project fixture.
+_PROJECT_FILES = {
+    "prune": {"mod.py": _SRC_PRUNE_B},
+    "underscores": {"mod.py": _SRC_UNDERSCORES_B},
+    "processor_class": {"mymod.py": _SRC_PROCESSOR_CLASS_B},
+    "caller_chain": {"mod.py": _SRC_CALLER_CHAIN_B},
+    "modules": {"processor.py": _SRC_PROCESSOR_MODULE_B, "helper.py": _SRC_HELPER_MODULE_B},
+    "unresolved": {"mod.py": _SRC_UNRESOLVED_B},
+    "overlapping": {"mod.py": _SRC_OVERLAPPING_B},
+    "diamond": {"mod.py": _SRC_DIAMOND_B},
+    "self_call": {"mod.py": _SRC_SELF_CALL_B},
+    "async": {"mod.py": _SRC_ASYNC_B},
+    "shared_callee": {"mod.py": _SRC_SHARED_CALLEE_B},
+}
+
+
+@pytest.fixture(scope="module")
+def filter_project(project_factory):
+    """``filter_project(name)`` returns the shared project for ``_PROJECT_FILES[name]``."""
+    return lambda name: project_factory(name, _PROJECT_FILES[name])
+
+
+def _render(project, *argv: str) -> int:
+    """Run the CLI output stage on an already resolved project."""
+    args = _build_parser().parse_args([str(project.root), *argv])
+    return _render_from_project(project, args)
+
+
+def test_filter_combined_with_node_options(shared_project, capsys) -> None:
     """Test --filter works with various node display options."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def process_data():
-                return 1
-            
-            def calculate():
-                return 2
-            """
-        ),
-        encoding="utf-8",
-    )
-    
     # Filter with --label qualname
-    exit_code = main([
-        str(tmp_path),
-        "--format", "json",
-        "--filter", "process",
-        "--label", "qualname"
-    ])
-    captured = capsys.readouterr()
+    exit_code = _render(shared_project, "--format", "json", "--filter", "process", "--label", "qualname")
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = _loads(capsys.readouterr().out)
     symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
     assert "process_data" in symbol_names
     assert "calculate" not in symbol_names
 
 
-def test_filter_combined_with_cluster_options(tmp_path: Path) -> None:
+def test_filter_combined_with_cluster_options(tmp_path: Path, shared_project) -> None:
     """Test --filter works with clustering options."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def process():
-                return 1
-            
-            def calculate():
-                return 2
-            """
-        ),
-        encoding="utf-8",
-    )
-    
     output = tmp_path / "filtered.dot"
-    exit_code = main([
-        str(tmp_path),
+    exit_code = _render(
+        shared_project,
         "--format", "dot",
         "--filter", "process",
         "--no-cluster",
-        "-o", str(output)
-    ])
+        "-o", str(output),
+    )
     
     assert exit_code == 0
     assert output.exists()
 
 
-def test_filter_combined_with_prune_transitive(tmp_path: Path, capsys) -> None:
+def test_filter_combined_with_prune_transitive(filter_project, capsys) -> None:
     """Test --filter works with --prune-transitive."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def process():
-                helper()
-                bar()
-            
-            def helper():
-                bar()
-            
-            def bar():
-                return 1
-            """
-        ),
-        encoding="utf-8",
-    )
+    project = filter_project("prune")
     
-    exit_code = main([
-        str(tmp_path),
+    exit_code = _render(
+        project,
         "--format", "json",
         "--filter", "process",
         "--link-by-filter",
-        "--prune-transitive"
-    ])
-    captured = capsys.readouterr()
+        "--prune-transitive",
+    )
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = _loads(capsys.readouterr().out)
     
     # All nodes should be present
     symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
@@ -103,30 +242,15 @@ def test_filter_combined_with_prune_transitive(tmp_path: Path, capsys) -> None:
     assert "bar" in symbol_names
 
 
-def test_filter_with_special_characters_in_keyword(tmp_path: Path, capsys) -> None:
+def test_filter_with_special_characters_in_keyword(filter_project, capsys) -> None:
     """Test --filter with special characters in keyword."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def process_data():
-                return 1
-            
-            def __init__():
-                return 2
-            
-            def _private_method():
-                return 3
-            """
-        ),
-        encoding="utf-8",
-    )
+    project = filter_project("underscores")
     
     # Filter for underscore patterns
-    exit_code = main([str(tmp_path), "--format", "json", "--filter", "_"])
-    captured = capsys.readouterr()
+    exit_code = _render(project, "--format", "json", "--filter", "_")
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = _loads(capsys.readouterr().out)
     
     symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
     assert "process_data" in symbol_names  # contains _
@@ -134,64 +258,60 @@ def test_filter_with_special_characters_in_keyword(tmp_path: Path, capsys) -> No
     assert "_private_method" in symbol_names  # contains _
 
 
-def test_filter_matches_qualname_not_just_name(tmp_path: Path, capsys) -> None:
-    """Test --filter matches against qualname (module.class.method)."""
-    (tmp_path / "mymod.py").write_text(
-        textwrap.dedent(
-            """
-            class Processor:
-                def process(self):
-                    return 1
-            
-            def helper():
-                return 2
-            """
-        ),
-        encoding="utf-8",
+def test_filter_keywords_are_literal_not_regex(shared_project, capsys) -> None:
+    """Test --filter treats regex metacharacters in keywords literally."""
+    exit_code = _render(shared_project, "--format", "json", "--filter", "proc.ss,help*,calc")
+
+    assert exit_code == 0
+    assert_symbols(
+        _loads(capsys.readouterr().out),
+        included=["calculate"],
+        excluded=["process", "process_data", "helper"],
     )
+
+
+@pytest.mark.parametrize("raw_filter", ["", " , "])
+def test_filter_without_keywords_renders_nothing(shared_project, capsys, raw_filter) -> None:
+    """A --filter with no keywords matches nothing, even on an already resolved project."""
+    exit_code = _render(shared_project, "--format", "json", "--filter", raw_filter)
+
+    assert exit_code == 0
+    data = _loads(capsys.readouterr().out)
+    assert data["symbols"] == []
+    assert data["calls"] == []
+    assert shared_project.symbols
+
+
+def test_filter_matches_qualname_not_just_name(filter_project, capsys) -> None:
+    """Test --filter matches against qualname (module.class.method)."""
+    project = filter_project("processor_class")
     
     # Filter for "Processor" should match the class's methods too
-    exit_code = main([str(tmp_path), "--format", "json", "--filter", "Processor"])
-    captured = capsys.readouterr()
+    exit_code = _render(project, "--format", "json", "--filter", "Processor")
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = _loads(capsys.readouterr().out)
     
     # Should match "Processor" class and its methods via qualname
     symbol_qualnames = [s["qualname"] for s in data["symbols"]]
     assert any("Processor" in qn for qn in symbol_qualnames)
 
 
-def test_link_by_filter_does_not_include_callers(tmp_path: Path, capsys) -> None:
+def test_link_by_filter_does_not_include_callers(filter_project, capsys) -> None:
     """Test --link-by-filter includes callees but NOT callers."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def caller():
-                process()
-            
-            def process():
-                helper()
-            
-            def helper():
-                return 1
-            """
-        ),
-        encoding="utf-8",
-    )
+    project = filter_project("caller_chain")
     
     # Filter for "process" - should include process and helper (callee)
     # Should NOT include caller (even though it calls process)
-    exit_code = main([
-        str(tmp_path),
+    exit_code = _render(
+        project,
         "--format", "json",
         "--filter", "process",
-        "--link-by-filter"
-    ])
-    captured = capsys.readouterr()
+        "--link-by-filter",
+    )
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = _loads(capsys.readouterr().out)
     
     symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
     assert "process" in symbol_names  # matched
@@ -199,128 +319,64 @@ def test_link_by_filter_does_not_include_callers(tmp_path: Path, capsys) -> None
     assert "caller" not in symbol_names  # caller should NOT be included
 
 
-def test_filter_with_module_names(tmp_path: Path, capsys) -> None:
+def test_filter_with_module_names(filter_project, capsys) -> None:
     """Test --filter can match module names."""
-    (tmp_path / "processor.py").write_text(
-        textwrap.dedent(
-            """
-            def run():
-                return 1
-            """
-        ),
-        encoding="utf-8",
-    )
-    
-    (tmp_path / "helper.py").write_text(
-        textwrap.dedent(
-            """
-            def assist():
-                return 2
-            """
-        ),
-        encoding="utf-8",
-    )
+    project = filter_project("modules")
     
     # Filter for "processor" at file level
-    exit_code = main([
-        str(tmp_path),
+    exit_code = _render(
+        project,
         "--format", "json",
         "--node-type", "file",
-        "--filter", "processor"
-    ])
-    captured = capsys.readouterr()
+        "--filter", "processor",
+    )
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = _loads(capsys.readouterr().out)
     
     module_names = [s["module"] for s in data["symbols"] if s["kind"] == "module"]
     assert "processor" in module_names
     assert "helper" not in module_names
 
 
-def test_link_by_filter_with_unresolved_calls(tmp_path: Path, capsys) -> None:
+def test_link_by_filter_with_unresolved_calls(filter_project, capsys) -> None:
     """Test --link-by-filter handles unresolved calls gracefully."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def process():
-                unknown_function()  # unresolved call
-                helper()
-            
-            def helper():
-                return 1
-            """
-        ),
-        encoding="utf-8",
-    )
+    project = filter_project("unresolved")
     
-    exit_code = main([
-        str(tmp_path),
+    exit_code = _render(
+        project,
         "--format", "json",
         "--filter", "process",
-        "--link-by-filter"
-    ])
-    captured = capsys.readouterr()
+        "--link-by-filter",
+    )
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = _loads(capsys.readouterr().out)
     
     symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
     assert "process" in symbol_names
     assert "helper" in symbol_names
 
 
-def test_filter_with_summary_format(tmp_path: Path, capsys) -> None:
+def test_filter_with_summary_format(shared_project, capsys) -> None:
     """Test --filter works with summary format output."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def process():
-                return 1
-            
-            def calculate():
-                return 2
-            
-            def helper():
-                return 3
-            """
-        ),
-        encoding="utf-8",
-    )
-    
-    exit_code = main([str(tmp_path), "--format", "summary", "--filter", "process"])
-    captured = capsys.readouterr()
+    exit_code = _render(shared_project, "--format", "summary", "--filter", "process")
     
     assert exit_code == 0
     # Summary should reflect filtered counts
-    assert "Project root:" in captured.out
+    assert "Project root:" in capsys.readouterr().out
     # Should show filtered symbol count
 
 
-def test_multiple_filter_keywords_with_overlapping_matches(tmp_path: Path, capsys) -> None:
+def test_multiple_filter_keywords_with_overlapping_matches(filter_project, capsys) -> None:
     """Test multiple keywords that match overlapping sets of nodes."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def process_data():
-                return 1
-            
-            def data_processor():
-                return 2
-            
-            def handler():
-                return 3
-            """
-        ),
-        encoding="utf-8",
-    )
+    project = filter_project("overlapping")
     
     # Both keywords match process_data and data_processor
-    exit_code = main([str(tmp_path), "--format", "json", "--filter", "process,data"])
-    captured = capsys.readouterr()
+    exit_code = _render(project, "--format", "json", "--filter", "process,data")
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = _loads(capsys.readouterr().out)
     
     symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
     assert "process_data" in symbol_names
@@ -328,38 +384,19 @@ def test_multiple_filter_keywords_with_overlapping_matches(tmp_path: Path, capsy
     assert "handler" not in symbol_names
 
 
-def test_link_by_filter_with_diamond_dependency(tmp_path: Path, capsys) -> None:
+def test_link_by_filter_with_diamond_dependency(filter_project, capsys) -> None:
     """Test --link-by-filter with diamond-shaped call graph."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def process():
-                left()
-                right()
-            
-            def left():
-                bottom()
-            
-            def right():
-                bottom()
-            
-            def bottom():
-                return 1
-            """
-        ),
-        encoding="utf-8",
-    )
+    project = filter_project("diamond")
     
-    exit_code = main([
-        str(tmp_path),
+    exit_code = _render(
+        project,
         "--format", "json",
         "--filter", "process",
-        "--link-by-filter"
-    ])
-    captured = capsys.readouterr()
+        "--link-by-filter",
+    )
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = _loads(capsys.readouterr().out)
     
     symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
     # Should include all nodes in the diamond
@@ -369,70 +406,39 @@ def test_link_by_filter_with_diamond_dependency(tmp_path: Path, capsys) -> None:
     assert "bottom" in symbol_names
 
 
-def test_filter_no_impact_on_non_graph_formats(tmp_path: Path, capsys) -> None:
+def test_filter_no_impact_on_non_graph_formats(tmp_path: Path, shared_project, capsys) -> None:
     """Test that filter behavior is consistent across all output formats."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def process():
-                return 1
-            
-            def calculate():
-                return 2
-            """
-        ),
-        encoding="utf-8",
-    )
-    
     # Test JSON format
-    exit_code = main([str(tmp_path), "--format", "json", "--filter", "process"])
-    captured_json = capsys.readouterr()
+    exit_code = _render(shared_project, "--format", "json", "--filter", "process")
     assert exit_code == 0
-    json_data = json.loads(captured_json.out)
+    json_data = _loads(capsys.readouterr().out)
     json_names = [s["name"] for s in json_data["symbols"] if s["kind"] in ("function", "method")]
     
     # Test DOT format
     output_dot = tmp_path / "test.dot"
-    exit_code = main([str(tmp_path), "--format", "dot", "--filter", "process", "-o", str(output_dot)])
+    exit_code = _render(shared_project, "--format", "dot", "--filter", "process", "-o", str(output_dot))
     assert exit_code == 0
-    dot_content = output_dot.read_text(encoding="utf-8")
+    dot_content = output_dot.read_bytes()
     
     # Both should filter the same way
     assert "process" in json_names
     assert "calculate" not in json_names
-    assert "process" in dot_content
-    assert "calculate" not in dot_content
+    assert_in_output(dot_content, included=[b"process"], excluded=[b"calculate"])
 
 
-def test_link_by_filter_with_self_calls(tmp_path: Path, capsys) -> None:
+def test_link_by_filter_with_self_calls(filter_project, capsys) -> None:
     """Test --link-by-filter handles recursive/self-calls."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def process():
-                helper()
-                process()  # self-call
-            
-            def helper():
-                return 1
-            
-            def other():
-                return 2
-            """
-        ),
-        encoding="utf-8",
-    )
+    project = filter_project("self_call")
     
-    exit_code = main([
-        str(tmp_path),
+    exit_code = _render(
+        project,
         "--format", "json",
         "--filter", "process",
-        "--link-by-filter"
-    ])
-    captured = capsys.readouterr()
+        "--link-by-filter",
+    )
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = _loads(capsys.readouterr().out)
     
     symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
     assert "process" in symbol_names
@@ -440,29 +446,14 @@ def test_link_by_filter_with_self_calls(tmp_path: Path, capsys) -> None:
     assert "other" not in symbol_names
 
 
-def test_filter_with_async_functions(tmp_path: Path, capsys) -> None:
+def test_filter_with_async_functions(filter_project, capsys) -> None:
     """Test --filter works with async functions."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            async def process_async():
-                return 1
-            
-            async def calculate_async():
-                return 2
-            
-            def sync_process():
-                return 3
-            """
-        ),
-        encoding="utf-8",
-    )
+    project = filter_project("async")
     
-    exit_code = main([str(tmp_path), "--format", "json", "--filter", "process"])
-    captured = capsys.readouterr()
+    exit_code = _render(project, "--format", "json", "--filter", "process")
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = _loads(capsys.readouterr().out)
     
     symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
     assert "process_async" in symbol_names
@@ -470,71 +461,38 @@ def test_filter_with_async_functions(tmp_path: Path, capsys) -> None:
     assert "calculate_async" not in symbol_names
 
 
-def test_filter_combined_with_all_label_modes(tmp_path: Path) -> None:
+@pytest.mark.parametrize("label_mode", ["name", "qualname", "code"])
+def test_filter_combined_with_all_label_modes(tmp_path: Path, shared_project, label_mode: str) -> None:
     """Test --filter works with all label modes (name, qualname, code)."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def process():
-                return 1
-            
-            def calculate():
-                return 2
-            """
-        ),
-        encoding="utf-8",
+    output = tmp_path / f"test_{label_mode}.dot"
+    exit_code = _render(
+        shared_project,
+        "--format", "dot",
+        "--filter", "process",
+        "--label", label_mode,
+        "-o", str(output),
     )
     
-    for label_mode in ["name", "qualname", "code"]:
-        output = tmp_path / f"test_{label_mode}.dot"
-        exit_code = main([
-            str(tmp_path),
-            "--format", "dot",
-            "--filter", "process",
-            "--label", label_mode,
-            "-o", str(output)
-        ])
-        
-        assert exit_code == 0
-        assert output.exists()
-        content = output.read_text(encoding="utf-8")
-        assert "process" in content
-        assert "calculate" not in content
-
-
-def test_link_by_filter_respects_filter_scope(tmp_path: Path, capsys) -> None:
+    assert exit_code == 0
+    assert output.exists()
+    assert_in_output(output.read_bytes(), included=[b"process"], excluded=[b"calculate"])
+
+
+def test_link_by_filter_respects_filter_scope(filter_project, capsys) -> None:
     """Test --link-by-filter only follows calls from filtered nodes."""
-    (tmp_path / "mod.py").write_text(
-        textwrap.dedent(
-            """
-            def process():
-                shared()
-            
-            def calculate():
-                shared()
-            
-            def shared():
-                deep()
-            
-            def deep():
-                return 1
-            """
-        ),
-        encoding="utf-8",
-    )
+    project = filter_project("shared_callee")
     
     # Filter for "process" only - should include shared and deep via process's calls
     # Should NOT include calculate even though it also calls shared
-    exit_code = main([
-        str(tmp_path),
+    exit_code = _render(
+        project,
         "--format", "json",
         "--filter", "process",
-        "--link-by-filter"
-    ])
-    captured = capsys.readouterr()
+        "--link-by-filter",
+    )
     
     assert exit_code == 0
-    data = json.loads(captured.out)
+    data = _loads(capsys.readouterr().out)
     
     symbol_names = [s["name"] for s in data["symbols"] if s["kind"] in ("function", "method")]
     assert "process" in symbol_names
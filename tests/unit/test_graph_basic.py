@@ -1,60 +1,58 @@
-from pathlib import Path
+import dataclasses
 import textwrap
 
-from pycodemap import resolve_project, ResolverConfig
-from pycodemap import GraphConfig, build_call_graph
+import pytest
 
+from pycodemap import GraphConfig, RendererConfig
 
-def _make_simple_project(tmp_path: Path) -> None:
-    pkg = tmp_path / "pkg"
-    pkg.mkdir()
-    (pkg / "__init__.py").write_text("", encoding="utf-8")
-    (pkg / "a.py").write_text(
-        textwrap.dedent(
-            """
-            def f():
-                return 1
 
-            def g():
-                return f()
-            """
-        ),
-        encoding="utf-8",
-    )
+SIMPLE_SRC = textwrap.dedent(
+    """
+    def f():
+        return 1
 
+    def g():
+        return f()
+    """
+)
 
-def test_build_function_level_graph(tmp_path: Path) -> None:
-    _make_simple_project(tmp_path)
-    project = resolve_project(tmp_path, ResolverConfig())
+CHAIN_SRC = textwrap.dedent(
+    """
+    def f():
+        return 1
 
+    def g():
+        return f()
+
+    def h():
+        f()
+        g()
+    """
+)
+
+
+def test_build_function_level_graph(build_cached) -> None:
     cfg = GraphConfig(node_granularity="function", cluster_by_module=True)
-    graph = build_call_graph(project, cfg)
+    graph = build_cached(SIMPLE_SRC, cfg, module="pkg.a")
 
-    node_ids = set(graph.nodes.keys())
-    assert "pkg.a.f" in node_ids
-    assert "pkg.a.g" in node_ids
+    assert "pkg.a.f" in graph
+    assert "pkg.a.g" in graph
 
     # g -> f edge should exist
-    edges = {(e.src, e.dst) for e in graph.iter_edges()}
-    assert ("pkg.a.g", "pkg.a.f") in edges
+    assert graph.has_edge("pkg.a.g", "pkg.a.f")
 
     # clustering by module
     assert graph.nodes["pkg.a.f"].cluster == "pkg.a"
 
 
-def test_build_file_level_graph(tmp_path: Path) -> None:
-    _make_simple_project(tmp_path)
-    project = resolve_project(tmp_path, ResolverConfig())
-
+def test_build_file_level_graph(build_cached) -> None:
     cfg = GraphConfig(node_granularity="file", cluster_by_module=True)
-    graph = build_call_graph(project, cfg)
+    graph = build_cached(SIMPLE_SRC, cfg, module="pkg.a")
 
-    node_ids = set(graph.nodes.keys())
-    assert "pkg.a" in node_ids
+    assert "pkg.a" in graph
 
     # Self-loop edges are dropped; file-level aggregation should not emit pkg.a -> pkg.a
-    edges = {(e.src, e.dst) for e in graph.iter_edges()}
-    assert ("pkg.a", "pkg.a") not in edges
+    assert not graph.has_edge("pkg.a", "pkg.a")
 
     node = graph.nodes["pkg.a"]
     assert node.kind == "file"
@@ -62,45 +60,32 @@ def test_build_file_level_graph(tmp_path: Path) -> None:
     assert node.cluster == "pkg"
 
 
-def test_transitive_pruning(tmp_path: Path) -> None:
-    pkg = tmp_path / "pkg"
-    pkg.mkdir()
-    (pkg / "__init__.py").write_text("", encoding="utf-8")
-    (pkg / "a.py").write_text(
-        textwrap.dedent(
-            """
-            def f():
-                return 1
-
-            def g():
-                return f()
-
-            def h():
-                f()
-                g()
-            """
-        ),
-        encoding="utf-8",
-    )
-
-    project = resolve_project(tmp_path, ResolverConfig())
-
+def test_transitive_pruning(build_cached) -> None:
     cfg_full = GraphConfig(node_granularity="function", prune_transitive=False)
     cfg_pruned = GraphConfig(node_granularity="function", prune_transitive=True)
 
-    graph_full = build_call_graph(project, cfg_full)
-    graph_pruned = build_call_graph(project, cfg_pruned)
-
-    edges_full = {(e.src, e.dst) for e in graph_full.iter_edges()}
-    edges_pruned = {(e.src, e.dst) for e in graph_pruned.iter_edges()}
+    graph_full = build_cached(CHAIN_SRC, cfg_full, module="pkg.a")
+    graph_pruned = build_cached(CHAIN_SRC, cfg_pruned, module="pkg.a")
 
     # All three direct edges should exist in the full graph:
     # g -> f, h -> f, h -> g
-    assert ("pkg.a.g", "pkg.a.f") in edges_full
-    assert ("pkg.a.h", "pkg.a.f") in edges_full
-    assert ("pkg.a.h", "pkg.a.g") in edges_full
+    assert graph_full.has_edge("pkg.a.g", "pkg.a.f")
+    assert graph_full.has_edge("pkg.a.h", "pkg.a.f")
+    assert graph_full.has_edge("pkg.a.h", "pkg.a.g")
 
     # After transitive reduction, edge h -> f should be removed
-    assert ("pkg.a.h", "pkg.a.f") not in edges_pruned
-    assert ("pkg.a.h", "pkg.a.g") in edges_pruned
-    assert ("pkg.a.g", "pkg.a.f") in edges_pruned
+    assert not graph_pruned.has_edge("pkg.a.h", "pkg.a.f")
+    assert graph_pruned.has_edge("pkg.a.h", "pkg.a.g")
+    assert graph_pruned.has_edge("pkg.a.g", "pkg.a.f")
+
+
+def test_configs_are_frozen_and_hashable() -> None:
+    cfg = GraphConfig(filter_keywords=["a", "b"])
+    assert cfg.filter_keywords == ("a", "b")
+    assert cfg == GraphConfig(filter_keywords=("a", "b"))
+    assert hash(cfg) == hash(GraphConfig(filter_keywords=("a", "b")))
+    assert GraphConfig(filter_keywords=None).filter_keywords == ()
+    assert len({RendererConfig(), RendererConfig(label_mode="name")}) == 1
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.prune_transitive = True  # type: ignore[misc]
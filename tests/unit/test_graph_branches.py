@@ -1,4 +1,3 @@
-from pathlib import Path
 import textwrap
 
 from pycodemap.graph import (
@@ -21,30 +20,24 @@ def test_graph_edge_add_call_initializes_line_numbers() -> None:
     assert edge.line_numbers == [5]
 
 
-def test_build_call_graph_prunes_when_enabled(tmp_path: Path) -> None:
-    src = tmp_path / "chain.py"
-    src.write_text(
-        textwrap.dedent(
-            """
-            def a():
-                b()
-                c()
+def test_build_call_graph_prunes_when_enabled(build_cached) -> None:
+    src = textwrap.dedent(
+        """
+        def a():
+            b()
+            c()
 
-            def b():
-                c()
+        def b():
+            c()
 
-            def c():
-                pass
-            """
-        ),
-        encoding="utf-8",
+        def c():
+            pass
+        """
     )
-    from pycodemap.resolver import resolve_project
-    project = resolve_project(src)
     cfg = GraphConfig(node_granularity="function", prune_transitive=True)
-    graph = build_call_graph(project, cfg)
+    graph = build_cached(src, cfg, module="chain")
     # a->c should be pruned transitively
-    assert ("chain.a", "chain.c") not in graph.edges
+    assert not graph.has_edge("chain.a", "chain.c")
 
 
 def test_build_call_graph_invalid_granularity_raises() -> None:
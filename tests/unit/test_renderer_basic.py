@@ -3,8 +3,8 @@ from pathlib import Path
 import textwrap
 
 from pycodemap.resolver import resolve_project, ResolverConfig
-from pycodemap.graph import GraphConfig
-from pycodemap.renderer import RendererConfig, build_dot
+from pycodemap.graph import GraphConfig, build_call_graph
+from pycodemap.renderer import RendererConfig, build_dot, build_dot_from_graph
 from pycodemap.resolver import resolve_project
 
 
@@ -134,3 +134,14 @@ def test_qualname_label_returns_full_qualname(tmp_path: Path) -> None:
     assert 'label="pkg.a.f"' in dot
     assert 'label="pkg.a.g"' in dot
     assert '\\n' not in dot.split('label="pkg.a.f"')[0] if 'label="pkg.a.f"' in dot else True
+
+
+def test_build_dot_from_graph_reuses_one_graph(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    project = resolve_project(tmp_path, ResolverConfig())
+    graph_cfg = GraphConfig(node_granularity="function")
+    graph = build_call_graph(project, graph_cfg)
+
+    for mode in ("name", "qualname", "code"):
+        renderer_cfg = RendererConfig(label_mode=mode)
+        assert build_dot_from_graph(graph, project, renderer_cfg) == build_dot(project, graph_cfg, renderer_cfg)
@@ -5,8 +5,10 @@ import sys
 
 import textwrap
 
+import pytest
+
 import pycodemap.renderer as renderer
-from pycodemap.resolver import resolve_project
+from pycodemap.resolver import ResolvedProject, Symbol, resolve_project
 from pycodemap.graph import GraphConfig, GraphNode, GraphEdge, CallGraph
 from pycodemap.renderer import RendererConfig
 
@@ -68,6 +70,49 @@ def test_import_guard_sets_pygments_unavailable(tmp_path: Path, monkeypatch) ->
     renderer.PYGMENTS_AVAILABLE = True
 
 
+def test_pygments_is_only_loaded_for_code_labels(tmp_path: Path, monkeypatch) -> None:
+    _make_project(tmp_path)
+    project = resolve_project(tmp_path)
+    monkeypatch.setattr(renderer, "_PY_LEXER", None)
+
+    def fail():
+        raise AssertionError("pygments loaded for a name label")
+
+    with monkeypatch.context() as m:
+        m.setattr(renderer, "_ensure_pygments", fail)
+        renderer.build_dot(project, GraphConfig(node_granularity="function"), RendererConfig(label_mode="name"))
+
+    assert renderer._ensure_pygments() is True
+    assert renderer._PY_LEXER is not None
+
+
+def test_html_label_loads_pygments_on_first_use(monkeypatch) -> None:
+    pytest.importorskip("pygments")
+    monkeypatch.setattr(renderer, "_PY_LEXER", None)
+
+    label = renderer._build_html_label("m.f", "def f():\n    return 1", start_line=3)
+    assert label.startswith("<TABLE")
+    assert renderer._PY_LEXER is not None
+
+
+def test_plain_code_label_is_escaped_per_line(monkeypatch) -> None:
+    monkeypatch.setattr(renderer, "PYGMENTS_AVAILABLE", False)
+    sym = Symbol(
+        id="m.f", kind="function", name="f", qualname="m.f", module="m", file=Path("m.py"),
+        start_line=3, end_line=5, snippet='def f():\n    return "\\\\"\n\n',
+    )
+    project = ResolvedProject(root=Path("."), symbols={"m.f": sym}, calls=[])
+    node = GraphNode(id="m.f", label="f", kind="function", symbol_id="m.f")
+
+    label, is_html = renderer._node_label(node, project, RendererConfig(label_mode="code"))
+    assert not is_html
+    # The blank last line supplies the trailing line break
+    assert label == 'm.f\\ldef f():\\l    return \\"\\\\\\\\\\"\\l'
+
+    label, _ = renderer._node_label(node, project, RendererConfig(label_mode="code", show_line_numbers=True, max_snippet_lines=1))
+    assert label == "m.f\\l3: def f():\\l"
+
+
 def test_escape_label_handles_newlines_and_quotes() -> None:
     text = 'a\n"b" \\'
     escaped = renderer._escape_label(text)
@@ -76,6 +121,16 @@ def test_escape_label_handles_newlines_and_quotes() -> None:
     assert "\\\\" in escaped  # backslash escaped
 
 
+def test_escape_label_exact_output() -> None:
+    # Each character is escaped once; inserted backslashes are not re-escaped.
+    assert renderer._escape_label('a\\b\n"c"\n') == 'a\\\\b\\l\\"c\\"\\l'
+    assert renderer._escape_label("plain") == "plain"
+
+
+def test_escape_html_escapes_each_special_character_once() -> None:
+    assert renderer._escape_html('<a href="x">&amp;</a>') == "&lt;a href=&quot;x&quot;&gt;&amp;amp;&lt;/a&gt;"
+
+
 def test_html_label_without_line_numbers(tmp_path: Path, monkeypatch) -> None:
     _make_project(tmp_path)
     project = resolve_project(tmp_path)
@@ -1,7 +1,7 @@
 from pathlib import Path
 import pytest
 
-from pycodemap.resolver import resolve_project
+from pycodemap.resolver import resolve_project, validate_root
 
 
 def test_resolver_syntax_error(tmp_path: Path) -> None:
@@ -18,6 +18,14 @@ def test_resolver_non_py_extension(tmp_path: Path) -> None:
         resolve_project(not_py)
 
 
+def test_validate_root_resolves_and_rejects(tmp_path: Path) -> None:
+    (tmp_path / "a.py").write_text("", encoding="utf-8")
+    assert validate_root(tmp_path / "." / "a.py") == (tmp_path / "a.py").resolve()
+    assert validate_root(tmp_path) == tmp_path.resolve()
+    with pytest.raises(ValueError, match="does not exist"):
+        validate_root(tmp_path / "missing")
+
+
 def test_resolver_directory_without_files(tmp_path: Path) -> None:
     empty_dir = tmp_path / "empty"
     empty_dir.mkdir()
@@ -2,7 +2,9 @@ from pathlib import Path
 import textwrap
 import pytest
 import os
-from pycodemap import resolve_project, ResolverConfig
+import ast
+from pycodemap import resolve_from_ast, resolve_project, resolve_source, ResolverConfig
+from pycodemap import resolver
 from pycodemap.resolver import Symbol, _pick_best_symbol
 
 def test_resolver_discovers_symbols_and_calls(tmp_path: Path) -> None:
@@ -33,10 +35,13 @@ def test_resolver_discovers_symbols_and_calls(tmp_path: Path) -> None:
     # We should now have module + function + method + class symbols
     assert {"module", "function", "method", "class"} <= kinds
 
-    ids = sorted(project.symbols.keys())
+    ids = project.sorted_ids
+    assert ids == sorted(project.symbols)
     assert "pkg.a.f" in ids
     assert "pkg.a.C" in ids
-    assert any(id_.startswith("pkg.a.C.") for id_ in ids)  # method inside C
+    module_ids = project.symbols_by_module["pkg.a"]
+    assert any(id_.startswith("pkg.a.C.") for id_ in module_ids)  # method inside C
+    assert all(project.symbols[id_].module == "pkg.a" for id_ in module_ids)
 
     # Assert calls
     calls = project.calls
@@ -49,6 +54,28 @@ def test_resolver_discovers_symbols_and_calls(tmp_path: Path) -> None:
     assert call.location.file == Path("pkg/a.py")
     assert call.location.lineno > 0
 
+def test_resolve_from_ast_matches_resolve_project(tmp_path: Path) -> None:
+    source = textwrap.dedent(
+        """
+        def f():
+            return 1
+
+        class C:
+            def m(self):
+                return f()
+        """
+    )
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "a.py").write_text(source, encoding="utf-8")
+
+    from_disk = resolve_project(tmp_path)
+    from_ast = resolve_from_ast(ast.parse(source), "pkg.a", source, root=tmp_path)
+
+    assert from_ast.symbols == from_disk.symbols
+    assert from_ast.calls == from_disk.calls
+    assert from_ast.symbols["pkg.a.f"].file == Path("pkg/a.py")
+
 def test_pick_best_symbol_prefers_function_over_class() -> None:
     func = Symbol(
         id="m.foo",
@@ -73,4 +100,92 @@ def test_pick_best_symbol_prefers_function_over_class() -> None:
         snippet=None,
     )
     best = _pick_best_symbol([cls, func])
-    assert best.kind == "function"
\ No newline at end of file
+    assert best.kind == "function"
+
+def test_resolve_source_matches_single_file_resolve_project(tmp_path: Path) -> None:
+    source = "class C:\n    def m(self):\n        return helper()\n\ndef helper():\n    return C()\n"
+    path = tmp_path / "script.py"
+    path.write_text(source, encoding="utf-8")
+
+    from_file = resolve_project(path)
+    from_source = resolve_source("script", source, root=path)
+
+    assert from_source.root == from_file.root
+    assert list(from_source.symbols.items()) == list(from_file.symbols.items())
+    assert from_source.calls == from_file.calls
+
+    with pytest.raises(SyntaxError):
+        resolve_source("broken", "def f(:\n")
+
+
+def test_resolve_project_caches_until_files_change(tmp_path: Path) -> None:
+    mod = tmp_path / "mod.py"
+    mod.write_text("def f():\n    return 1\n", encoding="utf-8")
+
+    first = resolve_project(tmp_path)
+    again = resolve_project(tmp_path)
+    assert again.symbols["mod.f"] is first.symbols["mod.f"]
+
+    mod.write_text("def f():\n    return 1\n\ndef g():\n    return f()\n", encoding="utf-8")
+    changed = resolve_project(tmp_path)
+    assert changed.symbols["mod.f"] is not first.symbols["mod.f"]
+    assert "mod.g" in changed.symbols
+
+    resolve_project.cache_clear()
+    assert resolve_project(tmp_path).symbols["mod.f"] is not changed.symbols["mod.f"]
+
+
+def test_resolve_project_returns_independent_projects(tmp_path: Path) -> None:
+    (tmp_path / "mod.py").write_text("def f():\n    return g()\n\ndef g():\n    return 1\n", encoding="utf-8")
+
+    first = resolve_project(tmp_path)
+    assert first.sorted_ids == ["mod", "mod.f", "mod.g"]
+    with pytest.raises(AttributeError):
+        first.calls[0].callee_id = "HACK"  # type: ignore[misc]
+    del first.symbols["mod.g"]
+    first.calls.clear()
+
+    second = resolve_project(tmp_path)
+    assert second is not first
+    assert second.sorted_ids == ["mod", "mod.f", "mod.g"]
+    assert [c.callee_id for c in second.calls] == ["mod.g"]
+
+
+def _write_ring_project(tmp_path: Path) -> None:
+    for i in range(6):
+        (tmp_path / f"m{i}.py").write_text(
+            f"from m{(i + 1) % 6} import f{(i + 1) % 6}\n\n"
+            f"class C{i}:\n    def run(self):\n        return f{i}()\n\n"
+            f"def f{i}():\n    return f{(i + 1) % 6}()\n",
+            encoding="utf-8",
+        )
+
+
+def test_resolve_project_parallel_matches_serial(tmp_path: Path, monkeypatch) -> None:
+    _write_ring_project(tmp_path)
+    monkeypatch.setattr(resolver, "_PARALLEL_MIN_FILES", 1)
+
+    serial = resolve_project(tmp_path, ResolverConfig(max_workers=1))
+    parallel = resolve_project(tmp_path, ResolverConfig(max_workers=2))
+    assert parallel is not serial
+    assert list(parallel.symbols.items()) == list(serial.symbols.items())
+    assert parallel.calls == serial.calls
+    assert any(c.callee_id == "m1.f1" for c in parallel.calls)
+
+
+@pytest.mark.parametrize("max_workers, cpus", [(1, 8), (None, 1)])
+def test_resolve_project_scans_serially_without_spare_workers(tmp_path: Path, monkeypatch, max_workers, cpus) -> None:
+    _write_ring_project(tmp_path)
+    monkeypatch.setattr(resolver, "_PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr(resolver.os, "cpu_count", lambda: cpus)
+    monkeypatch.setattr(resolver, "ProcessPoolExecutor", None)
+
+    project = resolve_project(tmp_path, ResolverConfig(max_workers=max_workers))
+    assert "m0.f0" in project.symbols
+
+
+def test_symbol_is_immutable_and_slotted() -> None:
+    sym = Symbol(id="m.f", kind="function", name="f", qualname="m.f", module="m", file=Path("m.py"), start_line=1, end_line=1)
+    assert not hasattr(sym, "__dict__")
+    with pytest.raises(AttributeError):
+        sym.name = "g"  # type: ignore[misc]
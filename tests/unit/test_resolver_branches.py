@@ -1,4 +1,5 @@
 import ast
+import os
 import textwrap
 from pathlib import Path
 
@@ -9,18 +10,15 @@ from pycodemap.resolver import (
     _format_callee_expr,
     _resolve_callee_id,
     _pick_best_symbol,
-    _CallVisitor,
-    _SymbolVisitor,
+    _UnifiedVisitor,
     Symbol,
 )
 
 
-def test_iter_python_files_skips_symlinks_by_default(tmp_path: Path, monkeypatch) -> None:
+def test_iter_python_files_skips_symlinks_by_default(tmp_path: Path) -> None:
     (tmp_path / "keep.py").write_text("print('ok')", encoding="utf-8")
-    (tmp_path / "skip.py").write_text("print('skip')", encoding="utf-8")
-
-    real_is_symlink = Path.is_symlink
-    monkeypatch.setattr(Path, "is_symlink", lambda self: self.name == "skip.py")
+    (tmp_path / "target.txt").write_text("print('skip')", encoding="utf-8")
+    (tmp_path / "skip.py").symlink_to(tmp_path / "target.txt")
 
     paths_default = list(resolver._iter_python_files(tmp_path, ResolverConfig()))
     assert any(p.name == "keep.py" for p in paths_default)
@@ -29,7 +27,20 @@ def test_iter_python_files_skips_symlinks_by_default(tmp_path: Path, monkeypatch
     paths_follow = list(resolver._iter_python_files(tmp_path, ResolverConfig(follow_symlinks=True)))
     assert any(p.name == "skip.py" for p in paths_follow)
 
-    monkeypatch.setattr(Path, "is_symlink", real_is_symlink)
+
+def test_iter_python_files_matches_os_walk_order(tmp_path: Path) -> None:
+    for rel in ["a.py", "z.py", "pkg/b.py", "pkg/sub/c.py", "other/d.py", ".git/e.py", "pkg/notes.txt"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+    (tmp_path / "linked").symlink_to(tmp_path / "pkg", target_is_directory=True)
+
+    expected = []
+    for dirpath, dirnames, filenames in os.walk(tmp_path):
+        dirnames[:] = [d for d in dirnames if d != ".git"]
+        expected.extend(Path(dirpath) / f for f in filenames if f.endswith(".py"))
+
+    assert list(resolver._iter_python_files(tmp_path, ResolverConfig())) == expected
 
 
 def test_module_name_from_path_handles_nested() -> None:
@@ -37,20 +48,32 @@ def test_module_name_from_path_handles_nested() -> None:
     assert resolver._module_name_from_path(Path("pkg/sub/mod.py")) == "pkg.sub.mod"
 
 
+def test_module_names_and_qualnames_are_interned(tmp_path: Path) -> None:
+    first = resolver._module_name_from_path(Path("pkg/sub/mod.py"))
+    assert resolver._module_name_from_path(Path("pkg/sub/mod.py")) is first
+
+    (tmp_path / "m.py").write_text("def f():\n    f()\n", encoding="utf-8")
+    project = resolve_project(tmp_path, ResolverConfig(max_workers=1))
+    (call,) = project.calls
+    assert call.caller_id is project.symbols["m.f"].qualname
+
+
 def test_extract_snippet_clamps_bounds() -> None:
-    visitor = _SymbolVisitor(module="m", rel_path=Path("m.py"), source_lines=["line1\n"])
+    visitor = _UnifiedVisitor(module="m", rel_path=Path("m.py"), source_lines=["line1\n"])
     # start below 1 and end beyond length should be clamped
     assert visitor._extract_snippet(0, 10) == "line1\n"
 
 
+def test_extract_snippet_slices_line_ranges() -> None:
+    lines = ["a = 1\n", "def f():\n", "    return a\n", "x = f()"]
+    visitor = _UnifiedVisitor(module="m", rel_path=Path("m.py"), source_lines=lines)
+    assert visitor._extract_snippet(2, 3) == "def f():\n    return a\n"
+    assert visitor._extract_snippet(4, 4) == "x = f()"
+    assert visitor._extract_snippet(3, 2) == ""
+
+
 def test_current_caller_id_inside_function(monkeypatch) -> None:
-    visitor = _CallVisitor(
-        module="m",
-        rel_path=Path("m.py"),
-        symbol_index={},
-        symbol_index_flat={},
-        source_lines=[],
-    )
+    visitor = _UnifiedVisitor(module="m", rel_path=Path("m.py"), source_lines=[])
     visitor._ctx_stack = ["f"]
     assert visitor._current_caller_id() == "m.f"
 
@@ -65,6 +88,19 @@ def test_resolve_callee_id_global_unique_match() -> None:
     sym = Symbol(id="m.f", kind="function", name="f", qualname="m.f", module="m", file=Path("m.py"), start_line=1, end_line=1)
     symbol_index = {("m", "f"): [sym]}
     assert _resolve_callee_id("f", current_module="other", symbol_index=symbol_index) == "m.f"
+    name_index = resolver._build_name_index(symbol_index)
+    assert _resolve_callee_id("f", current_module="other", symbol_index=symbol_index, name_index=name_index) == "m.f"
+
+
+def test_resolve_callee_id_global_ambiguous_name_is_unresolved() -> None:
+    syms = [
+        Symbol(id=f"{mod}.f", kind="function", name="f", qualname=f"{mod}.f", module=mod, file=Path(f"{mod}.py"), start_line=1, end_line=1)
+        for mod in ("a", "b")
+    ]
+    symbol_index = {("a", "f"): [syms[0]], ("b", "f"): [syms[1]]}
+    name_index = resolver._build_name_index(symbol_index)
+    assert name_index == {"f": syms}
+    assert _resolve_callee_id("f", current_module="c", symbol_index=symbol_index, name_index=name_index) is None
 
 
 def test_resolve_callee_id_unknown_returns_none() -> None:
@@ -87,3 +123,42 @@ def test_call_visitor_records_unknown_calls(tmp_path: Path) -> None:
     project = resolve_project(src)
     # Should record a call with raw_callee "<unknown>" for the lambda call
     assert any(call.raw_callee == "<unknown>" and call.callee_id is None for call in project.calls)
+
+
+def test_resolve_calls_resolves_each_callee_once(monkeypatch) -> None:
+    sym = Symbol(id="m.f", kind="function", name="f", qualname="m.f", module="m", file=Path("m.py"), start_line=1, end_line=1)
+    seen = []
+    real_resolve = resolver._resolve_callee_id
+
+    def counting_resolve(**kwargs):
+        seen.append(kwargs["raw_callee"])
+        return real_resolve(**kwargs)
+
+    monkeypatch.setattr(resolver, "_resolve_callee_id", counting_resolve)
+    visitor = _UnifiedVisitor(module="m", rel_path=Path("m.py"), source_lines=[])
+    visitor.visit(ast.parse("f()\nf()\ng()\n"))
+    calls = resolver._resolve_calls(
+        visitor.pending_calls,
+        module="m",
+        symbol_index={("m", "f"): [sym]},
+        symbol_index_flat={"m.f": sym},
+    )
+
+    assert [c.callee_id for c in calls] == ["m.f", "m.f", None]
+    assert seen == ["f", "g"]
+
+
+def test_unified_visitor_collects_symbols_and_calls_in_one_walk() -> None:
+    source = "class C:\n    def m(self):\n        helper()\n\ndef helper():\n    pass\n\nC()\n"
+    visitor = _UnifiedVisitor(module="m", rel_path=Path("m.py"), source_lines=source.splitlines(keepends=True))
+    visitor.visit(ast.parse(source))
+
+    assert [(s.id, s.kind) for s in visitor.symbols] == [
+        ("m.C", "class"),
+        ("m.C.m", "method"),
+        ("m.helper", "function"),
+    ]
+    assert [(caller, raw) for caller, _, raw in visitor.pending_calls] == [
+        ("m.C.m", "helper"),
+        ("m", "C"),
+    ]
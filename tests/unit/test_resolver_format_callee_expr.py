@@ -29,3 +29,12 @@ def test_format_callee_expr_dynamic_returns_none():
     # Call target is subscript, e.g., funcs[0]
     expr = _parse_expr("funcs[0]")
     assert r._format_callee_expr(expr, import_aliases={}) is None
+
+
+def test_format_callee_expr_deep_chain_and_dynamic_base():
+    expr = _parse_expr("m.a.b.c")
+    assert r._format_callee_expr(expr, import_aliases={"m": "pkg.mod"}) == "pkg.mod.a.b.c"
+
+    # Attribute chain hanging off a dynamic base
+    expr = _parse_expr("funcs[0].run")
+    assert r._format_callee_expr(expr, import_aliases={}) is None
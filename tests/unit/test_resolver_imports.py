@@ -152,3 +152,13 @@ def test_pick_best_symbol_prefers_function_over_class():
 
     best = resolver._pick_best_symbol([class_sym, func_sym])
     assert best is func_sym
+
+
+def test_pick_best_symbol_keeps_first_of_equal_rank():
+    cls = DummySym(id="pkg.a.C", kind="class", name="C", module="pkg.a")
+    attr = DummySym(id="pkg.a.C", kind="attribute", name="C", module="pkg.a")
+    method = DummySym(id="pkg.a.m", kind="method", name="m", module="pkg.a")
+    func = DummySym(id="pkg.a.m", kind="function", name="m", module="pkg.a")
+
+    assert resolver._pick_best_symbol([cls, attr]) is cls
+    assert resolver._pick_best_symbol([attr, cls, method, func]) is method
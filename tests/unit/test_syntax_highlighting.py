@@ -1,30 +1,41 @@
 """
 Tests for Pygments syntax highlighting in code labels.
 """
-import textwrap
-from pathlib import Path
+import pytest
 
-from pycodemap.resolver import resolve_project
+from helpers import assert_in_output
 from pycodemap.graph import GraphConfig
 from pycodemap.renderer import RendererConfig, build_dot
+from pycodemap.resolver import ResolvedProject
 
+# Every test here checks Pygments output; skip the module without it.
+pytest.importorskip("pygments")
 
-def test_code_label_with_syntax_highlighting(tmp_path: Path) -> None:
-    """Code labels should use Pygments syntax highlighting when available."""
-    
-    src = tmp_path / "sample.py"
-    src.write_text(
-        textwrap.dedent(
-            """
-            def calculate(x, y):
-                result = x + y
-                return result
-            """
-        ),
-        encoding="utf-8",
-    )
+
+SAMPLE_SRC = (
+    "def calculate(x, y):\n"
+    "    result = x + y\n"
+    "    return result\n"
+    "\n"
+    "def process():\n"
+    "    step1 = 1\n"
+    "    step2 = 2\n"
+    "    step3 = 3\n"
+    "    step4 = 4\n"
+    "    return step4\n"
+)
+
+
+@pytest.fixture(scope="module")
+def sample_project(resolve_cached) -> ResolvedProject:
+    """``sample.py`` with a short function and a longer one, resolved once."""
+    return resolve_cached("sample", SAMPLE_SRC)
+
+
+def test_code_label_with_syntax_highlighting(sample_project) -> None:
+    """Code labels should use Pygments syntax highlighting."""
     
-    project = resolve_project(src)
+    project = sample_project
     graph_cfg = GraphConfig(node_granularity="function")
     renderer_cfg = RendererConfig(
         label_mode="code",
@@ -34,46 +45,23 @@ def test_code_label_with_syntax_highlighting(tmp_path: Path) -> None:
     
     dot = build_dot(project, graph_cfg, renderer_cfg)
     
-    # Should contain qualname header
-    assert "sample.calculate" in dot
-    
-    # Should contain syntax-highlighted code (Pygments HTML tags)
-    # Look for common Pygments spans like keyword (def, return)
-    assert "def" in dot
-    assert "return" in dot
-    
-    # When Pygments is available, should have HTML table with FONT COLOR tags for highlighting
-    # Check for the HTML table structure and color formatting
-    has_highlighting = (
-        "<TABLE" in dot and
-        "</TABLE>" in dot and
-        '<FONT COLOR=' in dot  # Our HTML-like labels use FONT COLOR for syntax highlighting
+    # Qualname header, code content (def, return) and the HTML table with the
+    # FONT COLOR tags our labels use for syntax highlighting, in one scan
+    assert_in_output(
+        dot,
+        included=["sample.calculate", "calculate", "def", "return", "<TABLE", "</TABLE>", "<FONT COLOR="],
     )
-    
-    # If Pygments is not installed, highlighting won't be present but code should still work
-    assert "calculate" in dot
-    # At minimum, we should have the HTML table for code labels
-    assert "<TABLE" in dot
-    # Most importantly, assert that highlighting is actually present
-    assert has_highlighting, "Syntax highlighting with FONT COLOR tags should be present"
 
 
-def test_code_label_with_line_numbers_and_highlighting(tmp_path: Path) -> None:
+def test_code_label_with_line_numbers_and_highlighting(resolve_cached) -> None:
     """Syntax highlighting should work with line numbers enabled."""
     
-    src = tmp_path / "module.py"
-    src.write_text(
-        textwrap.dedent(
-            """
-            class Widget:
-                def render(self):
-                    print("rendering")
-            """
-        ),
-        encoding="utf-8",
+    project = resolve_cached(
+        "module",
+        "class Widget:\n"
+        "    def render(self):\n"
+        '        print("rendering")\n',
     )
-    
-    project = resolve_project(src)
     graph_cfg = GraphConfig(node_granularity="function")
     renderer_cfg = RendererConfig(
         label_mode="code",
@@ -83,47 +71,30 @@ def test_code_label_with_line_numbers_and_highlighting(tmp_path: Path) -> None:
     
     dot = build_dot(project, graph_cfg, renderer_cfg)
     
-    # Should have qualname
-    assert "module.Widget.render" in dot
-    
-    # Should have line numbers (method starts at line 2)
-    assert "2:" in dot or "3:" in dot
-    
-    # Should have code content
-    assert "render" in dot
+    # Qualname, line numbers (method starts at line 2) and code content
+    assert_in_output(dot, included=["module.Widget.render", "2:", "render"])
 
 
-def test_code_label_truncation_with_highlighting(tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    "max_snippet_lines,shown,hidden",
+    [
+        (2, "step1", "step2"),
+        (4, "step3", "step4"),
+    ],
+)
+def test_code_label_truncation_with_highlighting(
+    sample_project, max_snippet_lines: int, shown: str, hidden: str
+) -> None:
     """max_snippet_lines should truncate before highlighting."""
     
-    src = tmp_path / "long.py"
-    src.write_text(
-        textwrap.dedent(
-            """
-            def process():
-                step1 = 1
-                step2 = 2
-                step3 = 3
-                step4 = 4
-                return step4
-            """
-        ),
-        encoding="utf-8",
-    )
-    
-    project = resolve_project(src)
     graph_cfg = GraphConfig(node_granularity="function")
     renderer_cfg = RendererConfig(
         label_mode="code",
         show_line_numbers=False,
-        max_snippet_lines=2,  # Only first 2 lines
+        max_snippet_lines=max_snippet_lines,
     )
     
-    dot = build_dot(project, graph_cfg, renderer_cfg)
-    
-    # Should contain first lines
-    assert "step1" in dot
+    dot = build_dot(sample_project, graph_cfg, renderer_cfg)
     
-    # Should NOT contain later lines (truncated)
-    assert "step4" not in dot
-    assert "return step4" not in dot
+    # First lines are kept; later lines are truncated
+    assert_in_output(dot, included=[shown], excluded=[hidden, "return step4"])